@@ -1,11 +1,20 @@
 import os  # Import the os module for interacting with the operating system
+import numpy as np
 import pandas as pd  # Import pandas for data handling
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta  # Import datetime for working with dates
+from functools import lru_cache
 import google.generativeai as genai
 from flask import Flask, jsonify, request, render_template  # Import Flask and related functions for web server
+from flask.json.provider import DefaultJSONProvider
 import random
 from dotenv import load_dotenv
-import json
+import logging
+import orjson
+import re
+import tempfile
+import pyarrow.parquet as pq
+from convert_to_parquet import CSV_FILE_NAME, PARQUET_FILE_NAME, read_players_csv
 
 load_dotenv()
 
@@ -13,14 +22,32 @@ load_dotenv()
 ADMIN_KEY = os.environ.get("ADMIN_KEY")
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
 if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
+    # REST transport goes through requests/sockets, which gevent workers can yield on
+    # (the default gRPC transport blocks the whole worker)
+    genai.configure(api_key=GEMINI_API_KEY, transport='rest')
     model = genai.GenerativeModel('gemini-2.5-flash-lite')
 else:
     model = None
     print("WARNING: GEMINI_API_KEY is not set. AI features will be disabled.")
 
+# Gemini calls run on their own bounded pool so slow model round-trips are capped
+# (in both concurrency and time) separately from the fast game endpoints
+_GEMINI_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='gemini')
+GEMINI_TIMEOUT_SECONDS = 30
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify and request.json alike."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SORT_KEYS if self.sort_keys else 0
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Initialize Flask App
 app = Flask(__name__)  # Create a new Flask web application
+app.json = OrjsonProvider(app)
 app.debug = os.environ.get('FLASK_ENV') == 'development' or os.environ.get('DEBUG') == '1' or app.debug
 
 # Prevent browsers/CDNs from caching API responses.  Stale cached data
@@ -34,40 +61,60 @@ def set_cache_headers(response):
     return response
 
 # --- Data Loading and Processing ---
-try:
-    # Load the CSV file containing player data into a pandas DataFrame
-    players_df = pd.read_csv('brighton_players.csv', quotechar='"', escapechar='\\', on_bad_lines='skip')
-    print("DEBUG: Columns after loading:", players_df.columns.tolist())  # Print the column names for debugging
-    print("DEBUG: First 5 rows after loading:\n", players_df.head())  # Print the first 5 rows for debugging
+def split_names(names):
+    """Split a Series of full names into (first names, last names) Series.
+
+    Each name is stripped of whitespace and quotes and split on its first space; a name
+    with no space is all first name, and a missing name gives two empty strings.
+    """
+    cleaned = names.fillna("").astype(str).str.strip().str.strip('"')
+    parts = cleaned.str.split(' ', n=1, expand=True).reindex(columns=[0, 1])
+    return parts[0].fillna("").astype(str), parts[1].fillna("").astype(str)
+
+# Four-digit years in a seasons string such as '2010-2015, 2018-2020'
+_YEAR_RE = re.compile(r'\d{4}')
+
+def _extract_era(seasons_str):
+    """Extract decade(s) from a seasons string like '2010-2015, 2018-2020' → 'the 2010s'."""
+    if not seasons_str:
+        return ""
+    years = [int(y) for y in _YEAR_RE.findall(str(seasons_str))]
+    if not years:
+        return ""
+    first_decade = min(years) // 10 * 10
+    last_decade = max(years) // 10 * 10
+    if first_decade == last_decade:
+        return f"the {first_decade}s"
+    return f"the {first_decade}s and {last_decade}s"
+
+def _parquet_is_fresh():
+    """True if brighton_players.parquet exists and is at least as new as the CSV."""
+    try:
+        return os.path.getmtime(PARQUET_FILE_NAME) >= os.path.getmtime(CSV_FILE_NAME)
+    except OSError:
+        return False
+
+def load_players():
+    """Load the player data and derive the name, era and goals-clue columns.
+
+    Prefers the pre-typed Parquet copy (see convert_to_parquet.py), falling back to
+    the CSV when it is missing or older than the CSV.
+    """
+    if _parquet_is_fresh():
+        players_df = pq.read_table(PARQUET_FILE_NAME).to_pandas()
+    else:
+        players_df = read_players_csv(CSV_FILE_NAME)
+    if app.logger.isEnabledFor(logging.DEBUG):
+        app.logger.debug("Columns after loading: %s", players_df.columns.tolist())
+        app.logger.debug("First 5 rows after loading:\n%s", players_df.head())
 
     # Remove any rows where the player's name or date of birth is missing
     players_df = players_df.dropna(subset=['name', 'date of birth']).reset_index(drop=True)
 
-    # Find and print any rows where the name is empty or just spaces (should be none)
-    empty_name_rows = players_df[players_df['name'].str.strip() == '']
-    print('DEBUG: Rows with empty or whitespace-only names:')
-    print(empty_name_rows)
-
-    # Function to split a player's full name into first and last name
-    def split_name(name):
-        if pd.isna(name):  # If the name is missing, return empty strings
-            return "", ""
-        name_str = str(name).strip().strip('"')  # Clean up the name
-        if ' ' in name_str:  # If there is a space, split into first and last
-            parts = name_str.split(' ', 1)
-            return parts[0], parts[1]
-        else:  # If no space, treat the whole name as first name
-            return name_str, ""
-
-    # Apply the split_name function to every player's name
-    split_results = list(players_df['name'].map(split_name))
-    print("DEBUG: split_name results (first 10):", split_results[:10])  # Show first 10 results
-    print("DEBUG: Any non-2-length tuples?", [x for x in split_results if len(x) != 2])  # Check for errors
-    players_df['first name'], players_df['last name'] = zip(*split_results)  # Add new columns for first and last name
-
-    # Make sure all name and date fields are strings (not missing)
-    players_df['first name'] = players_df['first name'].fillna("").astype(str)
-    players_df['last name'] = players_df['last name'].fillna("").astype(str)
+    # Split every player's full name into first and last name in one vectorised pass
+    players_df['first name'], players_df['last name'] = split_names(players_df['name'])
+
+    # Make sure the date field is a string (not missing)
     players_df['date of birth'] = players_df['date of birth'].fillna("").astype(str)
     # Ensure new columns are present and fill missing values with empty strings
     for col in ['seasons played at Brighton', 'seasons at brighton during second spell']:
@@ -76,10 +123,27 @@ try:
         else:
             players_df[col] = players_df[col].fillna("").astype(str)
 
-    players_df = players_df.fillna("")
+    # Blank text cells become empty strings; blank counts stay <NA> in their nullable int columns
+    text_cols = players_df.select_dtypes(exclude='number').columns
+    players_df[text_cols] = players_df[text_cols].fillna("")
+
+    # Derive the era and goals clue text once here rather than in every build_clues call
+    players_df['_era'] = players_df['seasons played at Brighton'].map(_extract_era)
+    # Only text columns were filled above, so a blank goals cell is still <NA> here and
+    # gets no goals clue, while a real 0 still reads "scored 0 league goals"
+    goals_col = players_df['Brighton and Hove Albion league goals']
+    players_df['_goals_clue'] = np.where(
+        goals_col.notna(),
+        'This player scored ' + goals_col.astype(str) + ' league goals for Brighton.',
+        '',
+    )
+    return players_df
 
+try:
+    players_df = load_players()
     print("--- Successfully loaded and processed CSV ---")
-    print(players_df.head())  # Show first few rows after processing
+    if app.logger.isEnabledFor(logging.DEBUG):
+        app.logger.debug("First 5 rows after processing:\n%s", players_df.head())
 
 except FileNotFoundError:
     # If the CSV file is missing, print an error and stop the app
@@ -90,39 +154,103 @@ except Exception as e:
     print(f"FATAL ERROR loading or processing the CSV: {e}")
     exit()
 
+# Indices of players with at least 1 league appearance (the daily selection pool),
+# computed once here rather than on every request
+ELIGIBLE_INDICES = np.flatnonzero(
+    pd.to_numeric(players_df['Brighton and Hove Albion league appearances'], errors='coerce').fillna(0).to_numpy() > 0
+)
+
+# Player rows as plain dicts, indexed by position like players_df.iloc; looking
+# these up avoids building a new pandas Series on every request.  Each record
+# also carries its own 'player_id' (the positional index sent to the frontend).
+PLAYERS = players_df.to_dict(orient='records')
+for _player_id, _record in enumerate(PLAYERS):
+    _record['player_id'] = _player_id
+
 current_player_index = None  # Global override for local testing
 
 # File to store recent player selections
 # Use persistent volume path on Fly.io, local path otherwise
 DATA_DIR = os.environ.get('DATA_DIR', '.')
 RECENT_PLAYERS_FILE = os.path.join(DATA_DIR, 'recent_players.json')
+GEMINI_CACHE_FILE = os.path.join(DATA_DIR, 'gemini_cache.json')
 
 # Epoch date for the deterministic player cycle (calibrated so existing
 # daily selections are preserved when the algorithm was introduced)
 CYCLE_EPOCH = datetime(2025, 2, 25).date()
 
+# Maps smart quotes/curly apostrophes to straight ones when comparing guesses
+_QUOTE_TABLE = str.maketrans({'\u2019': "'", '\u2018': "'", '\u201c': '"', '\u201d': '"'})
+
+# Quote-normalized, lowercase (first name, last name) per player, indexed like players_df,
+# so /api/guess only has to normalize the user's input
+_NAMES_NORM = [(first.translate(_QUOTE_TABLE).lower(), last.translate(_QUOTE_TABLE).lower())
+               for first, last in zip(players_df['first name'], players_df['last name'])]
+
+# Today's selection, cached per process so repeat requests skip the JSON file
+# round-trip.  Keyed on the date, so it invalidates itself at midnight.
+_TODAY_CACHE = {'date': None, 'player': None}
+
+# Serialized /api/daily-challenge response for today's player, reused until the
+# date or the (debug-overridden) player changes
+_CHALLENGE_CACHE = {'date': None, 'player_id': None, 'body': None}
+
 def load_recent_players():
-    """Load the list of recently selected players from file."""
+    """Load the recently selected players from file, keyed by 'YYYY-MM-DD' date string."""
     try:
-        with open(RECENT_PLAYERS_FILE, 'r') as f:
-            data = json.load(f)
-            # Convert dates back to datetime objects
-            recent_players = {}
-            for date_str, player_id in data.items():
-                recent_players[datetime.fromisoformat(date_str)] = player_id
-            return recent_players
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(RECENT_PLAYERS_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+        # Older files used full ISO datetimes ('2025-07-12T00:00:00') as keys; keep just the date
+        return {date_str[:10]: player_id for date_str, player_id in data.items()}
+    except (FileNotFoundError, orjson.JSONDecodeError):
         return {}
 
+def _write_atomically(path, data):
+    """Write bytes to path through a uniquely named temp file that is then swapped into place.
+
+    A crash mid-write can never leave a truncated file behind, and the gunicorn worker
+    processes never share (and clobber) one another's temp file.
+    """
+    fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, path)
+    except BaseException:
+        os.remove(tmp_file)
+        raise
+
 def save_recent_players(recent_players):
-    """Save the list of recently selected players to file."""
-    # Convert datetime objects to ISO format strings for JSON serialization
-    data = {}
-    for date, player_id in recent_players.items():
-        data[date.isoformat()] = player_id
-    
-    with open(RECENT_PLAYERS_FILE, 'w') as f:
-        json.dump(data, f)
+    """Save the recently selected players to file (atomically, see _write_atomically)."""
+    _write_atomically(RECENT_PLAYERS_FILE, orjson.dumps(recent_players))
+
+def load_gemini_cache():
+    """Load cached Gemini responses from file as (cryptic clues, bios), each keyed by player name."""
+    try:
+        with open(GEMINI_CACHE_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+        return data.get('cryptic', {}), data.get('bio', {})
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}, {}
+
+def save_gemini_cache():
+    """Merge this worker's cached Gemini responses into gemini_cache.json (atomically).
+
+    Each gunicorn worker holds its own in-memory cache, so the file is re-read and
+    merged rather than overwritten, keeping entries the other worker has saved.
+    """
+    try:
+        cryptic, bio = load_gemini_cache()
+        cryptic.update(_CRYPTIC_CACHE)
+        bio.update(_BIO_CACHE)
+        _write_atomically(GEMINI_CACHE_FILE, orjson.dumps({'cryptic': cryptic, 'bio': bio}))
+    except OSError as e:
+        print(f"WARNING: Could not save gemini_cache.json: {e}")
+
+# Gemini output per player, so each clue/bio costs one model call rather than one per
+# request.  Keyed by player name rather than index, so a replaced CSV row never
+# inherits another player's cached text.
+_CRYPTIC_CACHE, _BIO_CACHE = load_gemini_cache()
 
 @app.route('/api/set-player', methods=['POST'])
 def set_player():
@@ -137,6 +265,18 @@ def set_player():
     else:
         return jsonify({'error': 'Invalid player index'}), 400
 
+@lru_cache(maxsize=1)
+def _cycle_order(cycle_number):
+    """The shuffled order of eligible player indices for one selection cycle.
+
+    Seeds the RNG with the cycle number to produce a unique permutation per
+    cycle; the order is fixed for the whole cycle, so it is only shuffled once.
+    """
+    rng = random.Random(cycle_number)
+    shuffled = ELIGIBLE_INDICES.tolist()
+    rng.shuffle(shuffled)
+    return tuple(shuffled)
+
 def get_daily_player():
     """Get today's player using a deterministic permutation cycle.
 
@@ -148,57 +288,40 @@ def get_daily_player():
     global current_player_index
 
     if app.debug and current_player_index is not None:
-        player = players_df.iloc[current_player_index]
+        player = PLAYERS[current_player_index]
         return player
 
     today = datetime.now().date()
 
-    # Get all player indices that have at least 1 league appearance
-    eligible_indices = [idx for idx in range(len(players_df))
-                        if players_df.iloc[idx]['Brighton and Hove Albion league appearances'] > 0]
-    pool_size = len(eligible_indices)
+    # The selection only changes at midnight, so serve repeat calls from the cache
+    if _TODAY_CACHE['date'] == today:
+        return _TODAY_CACHE['player']
+
+    pool_size = len(ELIGIBLE_INDICES)
 
     # Calculate which day of the overall cycle we're on
     day_number = (today - CYCLE_EPOCH).days
     cycle_number = day_number // pool_size
     position_in_cycle = day_number % pool_size
 
-    # Seed RNG with the cycle number to produce a unique permutation per cycle
-    rng = random.Random(cycle_number)
-    shuffled = list(eligible_indices)
-    rng.shuffle(shuffled)
-
-    selected_index = shuffled[position_in_cycle]
+    selected_index = _cycle_order(cycle_number)[position_in_cycle]
 
     # Record this selection in recent_players.json (for debug/history)
     try:
         recent_players = load_recent_players()
-        cutoff_date = today - timedelta(days=30)
-        recent_players = {date: player_id for date, player_id in recent_players.items()
-                         if date.date() >= cutoff_date}
-        today_key = datetime.combine(today, datetime.min.time())
-        recent_players[today_key] = selected_index
+        cutoff_key = (today - timedelta(days=30)).isoformat()
+        recent_players = {date_str: player_id for date_str, player_id in recent_players.items()
+                         if date_str >= cutoff_key}
+        recent_players[today.isoformat()] = selected_index
         save_recent_players(recent_players)
     except Exception as e:
         print(f"WARNING: Could not save recent_players.json: {e}")
 
-    player = players_df.iloc[selected_index]
-    print(f"DEBUG: Cycle {cycle_number}, position {position_in_cycle}/{pool_size}, selected: {player['name']}")
+    player = PLAYERS[selected_index]
+    app.logger.debug("Cycle %s, position %s/%s, selected: %s", cycle_number, position_in_cycle, pool_size, player['name'])
+    _TODAY_CACHE.update(date=today, player=player)
     return player
 
-def _extract_era(seasons_str):
-    """Extract decade(s) from a seasons string like '2010-2015, 2018-2020' → 'the 2010s'."""
-    if not seasons_str:
-        return ""
-    import re
-    years = re.findall(r'(\d{4})', str(seasons_str))
-    if not years:
-        return ""
-    decades = sorted(set(int(y) // 10 * 10 for y in years))
-    if len(decades) == 1:
-        return f"the {decades[0]}s"
-    return f"the {decades[0]}s and {decades[-1]}s"
-
 def build_clues(player, seed=None):
     """
     Build a list of clues for a player, avoiding clues that repeat the same facts.
@@ -207,9 +330,20 @@ def build_clues(player, seed=None):
     """
     facts_used = set()
     clues = []
-    # Custom logic for the 'left_for' clue
+    # Read each field once up front; the clue templates below reference these locals
+    seasons = player['seasons played at Brighton']
+    seasons2 = player['seasons at brighton during second spell']
+    place = player['place of birth']
+    country = player['country of birth']
+    dob = player['date of birth']
+    position = player['position']
+    spells = player['number of spells at Brighton and Hove Albion']
+    apps = player['Brighton and Hove Albion league appearances']
+    joined_from = player['Team played for before Brighton and Hove Albion (first spell)']
     left_for_value = player['Team played for after Brighton and Hove Albion (first spell)']
-    seasons_str = player['seasons played at Brighton'] if player['seasons played at Brighton'] else ""
+
+    # Custom logic for the 'left_for' clue
+    seasons_str = seasons if seasons else ""
     # An open-ended season like "2022-" already implies the player is still at the club,
     # so suppress the redundant "still at the club" clue in that case.
     seasons_implies_current = bool(seasons_str and str(seasons_str).strip().endswith('-'))
@@ -223,34 +357,31 @@ def build_clues(player, seed=None):
     else:
         left_for_clue = ""
 
-    # Era clue derived from seasons
-    era = _extract_era(player['seasons played at Brighton'])
+    # Era clue derived from seasons (the era and goals text are precomputed at load time)
+    era = player['_era']
     era_clue = f"This player played for Brighton during {era}." if era else ""
-
-    # Goals clue
-    goals = player['Brighton and Hove Albion league goals']
-    goals_clue = f"This player scored {goals} league goals for Brighton." if pd.notna(goals) else ""
+    goals_clue = player['_goals_clue']
 
     # Define clues in difficulty tiers (hard → medium → easy)
     # Tier 1 (Hard/vague): broad facts that apply to many players
     # Only include the era clue if there's no specific seasons data (era is redundant when seasons is shown)
     tier_1 = [
-        (era_clue if not player['seasons played at Brighton'] else "", {'era'}),
-        (f"This player was born in {player['place of birth']}, {player['country of birth']} and has {player['number of spells at Brighton and Hove Albion']} spell(s) at Brighton.", {'birth', 'spells'}),
-        (f"Seasons at Brighton: {player['seasons played at Brighton']}" if player['seasons played at Brighton'] else "", {'seasons'}),
-        (f"Seasons at Brighton during second spell: {player['seasons at brighton during second spell']}" if player['seasons at brighton during second spell'] else "", {'seasons2'}),
+        (era_clue if not seasons else "", {'era'}),
+        (f"This player was born in {place}, {country} and has {spells} spell(s) at Brighton.", {'birth', 'spells'}),
+        (f"Seasons at Brighton: {seasons}" if seasons else "", {'seasons'}),
+        (f"Seasons at Brighton during second spell: {seasons2}" if seasons2 else "", {'seasons2'}),
     ]
     # Tier 2 (Medium): narrows the field considerably
     tier_2 = [
-        (f"This player made {player['Brighton and Hove Albion league appearances']} league appearances for Brighton.", {'appearances'}),
+        (f"This player made {apps} league appearances for Brighton." if pd.notna(apps) else "", {'appearances'}),
         (goals_clue, {'goals'}),
-        (f"This player joined Brighton from {player['Team played for before Brighton and Hove Albion (first spell)']}", {'joined_from'}),
+        (f"This player joined Brighton from {joined_from}", {'joined_from'}),
         (left_for_clue, {'left_for'}),
     ]
     # Tier 3 (Easy/most revealing): strongly identifies the player
     tier_3 = [
-        (f"This player is a {player['position']}.", {'position'}),
-        (f"This player was born on {player['date of birth']}, in {player['place of birth']}, {player['country of birth']}.", {'birth'}),
+        (f"This player is a {position}.", {'position'}),
+        (f"This player was born on {dob}, in {place}, {country}.", {'birth'}),
     ]
 
     # Remove empty clues from each tier
@@ -264,7 +395,8 @@ def build_clues(player, seed=None):
     # playing across the day boundary.  Use the player's DataFrame index
     # instead, which is stable for the lifetime of the game session.
     if seed is None:
-        seed = str(player.name)
+        # PLAYERS records carry 'player_id'; a players_df row has its index as .name instead
+        seed = str(player['player_id'] if 'player_id' in player else player.name)
     rng = random.Random(seed)
     rng.shuffle(tier_1)
     rng.shuffle(tier_2)
@@ -279,20 +411,36 @@ def build_clues(player, seed=None):
             facts_used.update(tags)
     return clues
 
+@lru_cache(maxsize=1024)
+def _player_clues(player_id):
+    """Memoized build_clues for a player, seeded by their index as the routes expect.
+
+    The clue order depends only on the player (never the date), so one entry
+    per player serves every request for them.
+    """
+    return tuple(build_clues(PLAYERS[player_id], seed=str(player_id)))
+
 # --- API Routes ---
 @app.route('/api/daily-challenge', methods=['GET'])  # Define a web API endpoint for the daily challenge
 def get_challenge():
     try:
         player = get_daily_player()  # Get today's player
-        clues = build_clues(player)
-        return jsonify({
+        player_id = player['player_id']
+        today = datetime.now().date()
+        # The payload only changes when the player does, so reuse today's serialized body
+        if _CHALLENGE_CACHE['date'] == today and _CHALLENGE_CACHE['player_id'] == player_id:
+            return app.response_class(_CHALLENGE_CACHE['body'], mimetype='application/json')
+        clues = _player_clues(player_id)
+        body = app.json.dumps({
             'firstNameLength': len(player['first name']),
             'lastNameLength': len(player['last name']),
             'firstClue': clues[0],
-            'player_id': int(player.name),
+            'player_id': player_id,
             'firstName': player['first name'],
             'lastName': player['last name']
         })
+        _CHALLENGE_CACHE.update(date=today, player_id=player_id, body=body)
+        return app.response_class(body, mimetype='application/json')
     except KeyError as e:
         # If a column is missing, return an error
         return jsonify({'error': f"A column is missing in the CSV file: {e}"}), 500
@@ -305,8 +453,7 @@ def get_clue():
     try:
         data = request.json  # Get the data sent by the frontend
         player_id = data.get('player_id')  # Get the player's index
-        player = players_df.iloc[int(player_id)]  # Get the player's data
-        clues = build_clues(player, seed=str(player_id))
+        clues = _player_clues(int(player_id))  # Get the player's (memoized) clues
         return jsonify({'clue': clues[data.get('clue_index', 0)]})  # Return the requested clue
     except KeyError as e:
         # If a column is missing, return an error
@@ -322,16 +469,14 @@ def check_guess():
         player_id = data.get('player_id')  # Get the player's index
         guess_first = data.get('guess_first', '').lower()  # Get the guessed first name (lowercase)
         guess_last = data.get('guess_last', '').lower()  # Get the guessed last name (lowercase)
-        player = players_df.iloc[int(player_id)]  # Get the player's data
+        player_first, player_last = _NAMES_NORM[int(player_id)]  # Pre-normalized player name
         # Normalize smart quotes/curly apostrophes to straight ones for comparison
-        def normalize(s):
-            return s.replace('\u2019', "'").replace('\u2018', "'").replace('\u201c', '"').replace('\u201d', '"')
-        # Check if the guess matches the player's name
-        is_correct = (normalize(guess_first) == normalize(player['first name'].lower()) and
-                      normalize(guess_last) == normalize(player['last name'].lower()))
+        is_correct = (guess_first.translate(_QUOTE_TABLE) == player_first and
+                      guess_last.translate(_QUOTE_TABLE) == player_last)
         response = {'correct': is_correct}  # Prepare the response
         if is_correct:
             # If correct, include the full name
+            player = PLAYERS[int(player_id)]
             response['fullName'] = f"{player['first name']} {player['last name']}".strip()
         return jsonify(response)  # Return whether the guess was correct
     except KeyError as e:
@@ -349,7 +494,10 @@ def get_cryptic_clue():
         
     try:
         data = request.json
-        player = players_df.iloc[int(data['player_id'])]
+        player = PLAYERS[int(data['player_id'])]
+        cached_clue = _CRYPTIC_CACHE.get(player['name'])
+        if cached_clue is not None:
+            return jsonify({'clue': cached_clue})
         prompt = f"""You are a witty cryptic clue setter for a football guessing game. Create ONE short cryptic clue based on wordplay of the footballer's name: "{player['name']}".
 
 Rules:
@@ -366,13 +514,17 @@ Examples:
 - "Welbeck": "A summoning gesture from a water source."
 """
 
-        response = model.generate_content(
+        future = _GEMINI_EXECUTOR.submit(
+            model.generate_content,
             prompt,
             generation_config=genai.types.GenerationConfig(
                 max_output_tokens=60,
                 temperature=0.9,
             )
         )
+        response = future.result(timeout=GEMINI_TIMEOUT_SECONDS)
+        _CRYPTIC_CACHE[player['name']] = response.text
+        save_gemini_cache()
         return jsonify({'clue': response.text})
     except Exception as e:
         print(f"Gemini API error for cryptic clue: {e}")
@@ -385,7 +537,10 @@ def get_player_bio():
 
     try:
         data = request.json
-        player = players_df.iloc[int(data['player_id'])]
+        player = PLAYERS[int(data['player_id'])]
+        cached_bio = _BIO_CACHE.get(player['name'])
+        if cached_bio is not None:
+            return jsonify({'bio': cached_bio})
         # Add new fields to the prompt if available
         prompt = f"""You are a knowledgeable football commentator. Write a short, engaging biography (2-3 sentences) for this Brighton & Hove Albion footballer based ONLY on the data below.
 
@@ -405,14 +560,18 @@ Instructions:
 3. Write in a confident, informative tone. Do not say information is limited or further research is needed.
 4. Reply with ONLY the bio text, no preamble.
 """
-        print(f"DEBUG: Player bio prompt:\n{prompt}")
-        response = model.generate_content(
+        app.logger.debug("Player bio prompt:\n%s", prompt)
+        future = _GEMINI_EXECUTOR.submit(
+            model.generate_content,
             prompt,
             generation_config=genai.types.GenerationConfig(
                 max_output_tokens=200,
                 temperature=0.7,
             )
         )
+        response = future.result(timeout=GEMINI_TIMEOUT_SECONDS)
+        _BIO_CACHE[player['name']] = response.text
+        save_gemini_cache()
         return jsonify({'bio': response.text})
     except Exception as e:
         print(f"Gemini API error for player bio: {e}")
@@ -426,7 +585,7 @@ def serve_index():
 
 @app.route('/api/config')
 def get_config():
-    print(f"DEBUG: /api/config called, app.debug={app.debug}")
+    app.logger.debug("/api/config called, app.debug=%s", app.debug)
     return jsonify({'isLocal': app.debug, 'playerCount': len(players_df)})
 
 @app.route('/api/debug/recent-players')
@@ -442,11 +601,12 @@ def debug_recent_players():
     
     # Format the data for display
     recent_data = []
-    for date, player_id in recent_players.items():
-        if date.date() >= today - timedelta(days=30):
-            player = players_df.iloc[player_id]
+    cutoff_key = (today - timedelta(days=30)).isoformat()
+    for date_str, player_id in recent_players.items():
+        if date_str >= cutoff_key:
+            player = PLAYERS[player_id]
             recent_data.append({
-                'date': date.date().isoformat(),
+                'date': date_str,
                 'player_id': player_id,
                 'player_name': player['name']
             })
@@ -463,7 +623,9 @@ def debug_reset_recent():
     if not app.debug:
         return jsonify({'error': 'Not allowed in production'}), 403
     
-    # Clear the recent players file
+    # Clear the recent players file, and the cached selection so today's
+    # player is recorded again on the next request
+    _TODAY_CACHE['date'] = None
     try:
         os.remove(RECENT_PLAYERS_FILE)
         return jsonify({'success': True, 'message': 'Recent players reset'})
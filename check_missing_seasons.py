@@ -1,15 +1,15 @@
 import pandas as pd
 
-# Load the CSV file
+# Load only the two columns this check needs
 csv_file = 'brighton_players.csv'
-df = pd.read_csv(csv_file)
+df = pd.read_csv(csv_file, usecols=['name', 'seasons played at Brighton'], dtype='string', keep_default_na=False)
 
 # Check for missing or empty 'seasons played at Brighton'
-missing_seasons = df[df['seasons played at Brighton'].isna() | (df['seasons played at Brighton'].astype(str).str.strip() == '')]
+missing_seasons = df[df['seasons played at Brighton'].str.strip() == '']
 
 if missing_seasons.empty:
     print('All players have a value for "seasons played at Brighton".')
 else:
     print('Players missing "seasons played at Brighton":')
-    for idx, row in missing_seasons.iterrows():
-        print(f"- {row['name']}") 
\ No newline at end of file
+    for name in missing_seasons['name']:
+        print(f"- {name}")
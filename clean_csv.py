@@ -1,22 +1,37 @@
+import io
 import re
 
+import pandas as pd
+
 input_file = 'brighton_players.csv'
 output_file = 'brighton_players_cleaned.csv'
+BLOCK_SIZE = 8 * 1024 * 1024  # Approximate characters of input handled per chunk
+# A field wrapped in doubled quotes (""Field, with, commas""): the "" pairs must sit at the
+# field's edges with content between them, so standard CSV escaping ("Dan ""Big"" Smith")
+# and empty quoted fields ("") never match
+DOUBLED_QUOTE_FIELD = re.compile(r'(?<![^,\n])""(?=[^",\r\n])(.*?)(?<=[^"])""(?![^,\r\n])')
 
-with open(input_file, 'r', encoding='utf-8') as infile, open(output_file, 'w', encoding='utf-8') as outfile:
-    for i, line in enumerate(infile):
-        line = line.strip()
-        if i == 0:
-            # Write header as-is
-            outfile.write(line + '\n')
-        else:
-            # Find all fields wrapped in double quotes, even if they contain commas
-            # Handles: ""Field, with, commas"" or ""Field""
-            fields = re.findall(r'""(.*?)""', line)
-            # If not found, fallback to single quoted fields
-            if not fields:
-                fields = re.findall(r'"(.*?)"', line)
-            # Write as comma-separated
-            outfile.write(','.join(fields) + '\n')
+with open(input_file, 'r', encoding='utf-8') as infile, open(output_file, 'w', encoding='utf-8', newline='') as outfile:
+    header = infile.readline()
+    write_header = True
+    while True:
+        # Pull whole lines in one large block rather than looping over them in Python
+        block = ''.join(infile.readlines(BLOCK_SIZE))
+        # An odd quote count means the block ends inside a quoted multi-line field:
+        # keep reading so every block stops on a record boundary
+        while block.count('"') % 2:
+            line = infile.readline()
+            if not line:
+                break
+            block += line
+        if not block and not write_header:
+            break
+        # Collapse doubled-quote wrapping to ordinary CSV quoting, then let pandas' C parser
+        # split the whole block
+        block = DOUBLED_QUOTE_FIELD.sub(r'"\1"', block)
+        chunk = pd.read_csv(io.StringIO(header + block), engine='c', dtype=str, keep_default_na=False,
+                            quotechar='"', escapechar='\\')
+        chunk.to_csv(outfile, header=write_header, index=False)
+        write_header = False
 
-print(f"Cleaned CSV written to {output_file}")
\ No newline at end of file
+print(f"Cleaned CSV written to {output_file}")
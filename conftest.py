@@ -0,0 +1,13 @@
+"""
+Shared pytest hooks for the Brighton Player Daily tests.
+"""
+
+
+def pytest_generate_tests(metafunc):
+    """Run any test that takes ``player_row_tuple`` once per player, with the name as its id."""
+    if "player_row_tuple" in metafunc.fixturenames:
+        # Imported here so sessions without per-player tests (e.g. test_scrapers.py) never load the app
+        import app as app_module
+
+        rows = list(app_module.players_df.itertuples(index=True, name="Player"))
+        metafunc.parametrize("player_row_tuple", rows, ids=[row.name for row in rows])
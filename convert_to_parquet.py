@@ -0,0 +1,47 @@
+"""
+One-shot conversion of brighton_players.csv to a typed, compressed Parquet file.
+
+The CSV stays the single source of truth; re-run this after every CSV edit
+(the Docker build runs it automatically).  app.py prefers the Parquet copy at
+startup because it skips CSV tokenisation and type inference entirely.
+
+Run with:  python convert_to_parquet.py
+"""
+
+import pandas as pd
+
+CSV_FILE_NAME = 'brighton_players.csv'
+PARQUET_FILE_NAME = 'brighton_players.parquet'
+
+# Every column the app reads, with explicit dtypes so pandas never has to guess.
+# The counts use pandas' nullable integer types so a blank cell loads as <NA>.
+PLAYER_DTYPES = {
+    'name': 'str',
+    'date of birth': 'str',
+    'place of birth': 'str',
+    'country of birth': 'str',
+    'position': 'str',
+    'Brighton and Hove Albion league appearances': 'Int32',
+    'Brighton and Hove Albion league goals': 'Int16',
+    'number of spells at Brighton and Hove Albion': 'Int8',
+    'Team played for before Brighton and Hove Albion (first spell)': 'str',
+    'Team played for after Brighton and Hove Albion (first spell)': 'str',
+    'seasons played at Brighton': 'str',
+    'seasons at brighton during second spell': 'str',
+}
+
+
+def read_players_csv(csv_file=CSV_FILE_NAME):
+    """Read the player CSV with explicit column dtypes; columns the file lacks are left out."""
+    return pd.read_csv(csv_file, usecols=lambda col: col in PLAYER_DTYPES, dtype=PLAYER_DTYPES,
+                       quotechar='"', escapechar='\\', on_bad_lines='skip')
+
+
+def main():
+    df = read_players_csv()
+    df.to_parquet(PARQUET_FILE_NAME, engine='pyarrow', compression='zstd', index=False)
+    print(f"Wrote {len(df)} players to {PARQUET_FILE_NAME}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,31 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import asyncio
+import csv
+import hashlib
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml.etree import XPath
 import re
 import time
 import os
+import shutil
+import sys
+import tempfile
+from functools import partial
 from urllib.parse import unquote
 
 # --- Configuration ---
 CSV_FILE_NAME = 'brighton_players.csv'
 
+CSV_COLUMNS = [
+    'name', 'date of birth', 'place of birth', 'country of birth', 'position',
+    'Brighton and Hove Albion league appearances', 'Brighton and Hove Albion league goals',
+    'number of spells at Brighton and Hove Albion',
+    'Team played for before Brighton and Hove Albion (first spell)',
+    'Team played for after Brighton and Hove Albion (first spell)',
+    'seasons played at Brighton', 'seasons at brighton during second spell'
+]
+
 # --- Output Mode ---
 # Set to True to create a new timestamped CSV file for checking.
 # Set to False to overwrite the existing CSV_FILE_NAME.
@@ -22,6 +39,41 @@ SEASONS_TO_RUN = ['2024-25']
 # --- Script Constants ---
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 HEADERS = {'User-Agent': USER_AGENT}
+CONCURRENCY = 8  # Maximum simultaneous requests to Wikipedia
+REQUEST_DELAY = 0.1  # Pause (seconds) after each request before its slot is released
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+# Retry transient failures (connection errors, timeouts, rate limiting, server errors)
+# with exponential backoff
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_EXCEPTIONS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+# Fetched pages are cached on disk so reruns skip the network; pass --no-cache to clear it
+CACHE_DIR = '.wiki_html_cache'
+CACHE_EXPIRE_SECONDS = 24 * 3600
+
+# Precompiled patterns used while parsing each page
+_RE_YEAR = re.compile(r'\d{4}')
+_RE_FOOTNOTE = re.compile(r'\[\d+\]')
+_RE_DISAMBIG = re.compile(r'\s*\((?:footballer|soccer|goalkeeper)[^)]*\)')
+# Season pages are only searched for squad tables, so nothing else is parsed. The class
+# attribute is still one unsplit string while parsing, so this needs a regex, not a list.
+_SQUAD_TABLE_STRAINER = SoupStrainer('table', class_=re.compile(r'wikitable|sortable'))
+
+# Precompiled XPath queries used by parse_player_page (evaluated in C by libxml2)
+_XP_INFOBOX = XPath('(//table[contains(concat(" ", normalize-space(@class), " "), " infobox ")])[1]')
+_XP_FN = XPath('(.//*[contains(concat(" ", normalize-space(@class), " "), " fn ")])[1]')
+_XP_CAPTION = XPath('(.//caption)[1]')
+_XP_DOB = XPath('(.//th[contains(., "Date of birth")])[1]/following-sibling::td[1]')
+_XP_POB = XPath('(.//th[contains(., "Place of birth")])[1]/following-sibling::td[1]')
+_XP_POS = XPath('(.//th[contains(., "Position")])[1]/following-sibling::td[1]')
+_XP_CAREER_TABLES = XPath('//table[contains(@class, "wikitable")]')
+_XP_TH = XPath('.//th')
+_XP_TD = XPath('.//td')
+_XP_ROWS = XPath('.//tr')
+_XP_CELLS = XPath('.//*[self::th or self::td]')
+# Text nodes as BeautifulSoup's get_text() sees them: no <style>/<script> contents
+_XP_TEXT = XPath('.//text()[not(ancestor::style or ancestor::script)]')
 
 # List of Wikipedia season URLs to scrape for player names
 SEASON_URLS = [
@@ -49,24 +101,74 @@ SEASON_URLS = [
     "https://en.wikipedia.org/wiki/2024%E2%80%9325_Brighton_%26_Hove_Albion_F.C._season"
 ]
 
-def get_soup(url):
-    """Fetches a URL and returns a BeautifulSoup object."""
+def cache_path(url):
+    """Returns the on-disk cache file for a URL."""
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.html')
+
+def clear_cache():
+    """Deletes every cached page."""
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+async def fetch(session, semaphore, url):
+    """Fetches a URL and returns the response body as text, holding a concurrency slot.
+
+    Pages fetched within the last CACHE_EXPIRE_SECONDS are read from CACHE_DIR instead.
+    """
+    path = cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_EXPIRE_SECONDS:
+            with open(path, encoding='utf-8') as f:
+                return f.read()
+    except OSError:
+        pass
+    async with semaphore:
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with session.get(url) as response:
+                    retry = response.status in RETRY_STATUSES and attempt < MAX_RETRIES
+                    if not retry:
+                        response.raise_for_status()
+                        text = await response.text()
+            except RETRY_EXCEPTIONS:
+                if attempt == MAX_RETRIES:
+                    raise
+                retry = True
+            if not retry:
+                break
+            await asyncio.sleep(BACKOFF_FACTOR * 2 ** attempt)
+        await asyncio.sleep(REQUEST_DELAY)
+    # Write through a temp file and swap it in, so an interrupted run never leaves a
+    # truncated page that would be served as a fresh cache hit
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
     try:
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-        return BeautifulSoup(response.text, 'lxml')
-    except requests.exceptions.RequestException as e:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return text
+
+async def get_soup(session, semaphore, url, parse_only=None):
+    """Fetches a URL and returns a BeautifulSoup object, optionally limited by a SoupStrainer."""
+    try:
+        text = await fetch(session, semaphore, url)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         print(f"Error fetching {url}: {e}")
         return None
+    # Parse in a worker thread so the event loop keeps other downloads moving
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(BeautifulSoup, text, 'lxml', parse_only=parse_only))
 
-def find_player_urls(season_url):
+async def find_player_urls(session, semaphore, season_url):
     """Finds all player Wikipedia URLs from the main squad table on a season page."""
-    soup = get_soup(season_url)
+    soup = await get_soup(session, semaphore, season_url, parse_only=_SQUAD_TABLE_STRAINER)
     if not soup:
         return set()
 
     player_links = set()
-    squad_tables = soup.find_all('table', class_=re.compile(r'wikitable|sortable'))
+    squad_tables = soup.select('table.wikitable, table.sortable')
 
     for table in squad_tables:
         headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
@@ -85,35 +187,55 @@ def find_player_urls(season_url):
     return player_links
 
 
+def first(elements):
+    """Returns the first element of an XPath result, or None if it is empty."""
+    return elements[0] if elements else None
+
 def clean_player_name(name):
     """Removes parenthetical disambiguation like (footballer, born 1983)."""
-    return re.sub(r'\s*\((footballer|soccer|goalkeeper)[^)]*\)', '', name).strip()
+    return _RE_DISAMBIG.sub('', name).strip()
 
-def parse_player_page(player_url):
+async def get_tree(session, semaphore, url):
+    """Fetches a URL and returns it parsed as an lxml.html document."""
+    try:
+        text = await fetch(session, semaphore, url)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"Error fetching {url}: {e}")
+        return None
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, lxml.html.fromstring, text)
+
+def _text(element):
+    """Equivalent of BeautifulSoup's get_text(strip=True) for an lxml element."""
+    return ''.join(s.strip() for s in _XP_TEXT(element))
+
+async def parse_player_page(session, semaphore, player_url):
     """Parses an individual player's page to extract detailed info."""
-    soup = get_soup(player_url)
-    if not soup:
+    tree = await get_tree(session, semaphore, player_url)
+    if tree is None:
         return None
 
-    infobox = soup.find('table', class_=re.compile(r'\binfobox\b'))
-    if not infobox:
+    infobox = first(_XP_INFOBOX(tree))
+    if infobox is None:
         print(f"  -> Warning: Could not find infobox for {player_url}")
         return None
 
     data = {}
     
-    name_element = infobox.find(class_=re.compile(r'\bfn\b')) or infobox.find('caption')
-    if name_element:
-        data['name'] = clean_player_name(name_element.get_text(strip=True))
+    name_element = first(_XP_FN(infobox))
+    if name_element is None:
+        name_element = first(_XP_CAPTION(infobox))
+    if name_element is not None:
+        data['name'] = clean_player_name(_text(name_element))
     else:
-        data['name'] = clean_player_name(soup.find('h1', {'id': 'firstHeading'}).get_text(strip=True))
+        data['name'] = clean_player_name(_text(tree.get_element_by_id('firstHeading')))
 
-    dob_label = infobox.find('th', string=re.compile('Date of birth'))
-    pob_label = infobox.find('th', string=re.compile('Place of birth'))
-    data['date of birth'] = dob_label.find_next_sibling('td').get_text(strip=True).split('(')[0].strip() if dob_label else ""
+    dob_cell = first(_XP_DOB(infobox))
+    pob_cell = first(_XP_POB(infobox))
+    data['date of birth'] = _text(dob_cell).split('(')[0].strip() if dob_cell is not None else ""
     
-    if pob_label:
-        pob_text = pob_label.find_next_sibling('td').get_text(strip=True)
+    if pob_cell is not None:
+        pob_text = _text(pob_cell)
         pob_parts = [p.strip() for p in pob_text.split(',')]
         data['place of birth'] = pob_parts[0]
         data['country of birth'] = pob_parts[-1] if len(pob_parts) > 1 else ""
@@ -121,63 +243,72 @@ def parse_player_page(player_url):
         data['place of birth'] = ""
         data['country of birth'] = ""
 
-    pos_label = infobox.find('th', string=re.compile('Position'))
-    data['position'] = pos_label.find_next_sibling('td').get_text(strip=True) if pos_label else ""
+    pos_cell = first(_XP_POS(infobox))
+    data['position'] = _text(pos_cell) if pos_cell is not None else ""
 
-    career_tables = soup.find_all('table', class_=re.compile(r'wikitable'))
+    career_tables = _XP_CAREER_TABLES(tree)
     brighton_spells = []
+    # Stripped text of each row's th/td cells, extracted once and reused by every pass below
+    row_texts = {}
     
     for table in career_tables:
-        headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
+        headers = [_text(th).lower() for th in _XP_TH(table)]
         if 'team' in headers and 'apps' in headers and '(gls)' in headers:
-            for row in table.find_all('tr'):
-                cols_text = [col.get_text(strip=True) for col in row.find_all(['th', 'td'])]
+            for row in _XP_ROWS(table):
+                cols_text = row_texts[row] = [_text(col) for col in _XP_CELLS(row)]
                 if any("Brighton & Hove Albion" in text for text in cols_text):
                      brighton_spells.append(row)
 
     total_apps, total_goals, spell_seasons = 0, 0, []
+    seen_seasons = set()  # O(1) membership; spell_seasons keeps first-seen order
     
     for spell in brighton_spells:
-        cols = spell.find_all(['th', 'td'])
-        try:
-            year_col_text = cols[0].get_text(strip=True)
-            if re.search(r'\d{4}', year_col_text):
-                seasons = re.sub(r'\[\d+\]', '', year_col_text).strip().replace('→', '').strip()
-                if seasons not in spell_seasons:
-                    spell_seasons.append(seasons)
-                
-                apps_text, goals_text = cols[-2].get_text(strip=True), cols[-1].get_text(strip=True).replace('(', '').replace(')', '')
-                total_apps += int(apps_text) if apps_text.isdigit() else 0
-                total_goals += int(goals_text) if goals_text.isdigit() else 0
-        except (ValueError, IndexError):
-            continue
+        # Never empty: the row was kept because one of its cells mentions Brighton
+        cols_text = row_texts[spell]
+        year_col_text = cols_text[0]
+        if _RE_YEAR.search(year_col_text):
+            seasons = _RE_FOOTNOTE.sub('', year_col_text).strip().replace('→', '').strip()
+            if seasons not in seen_seasons:
+                seen_seasons.add(seasons)
+                spell_seasons.append(seasons)
+
+            if len(cols_text) < 2:
+                continue
+            apps_text, goals_text = cols_text[-2], cols_text[-1].replace('(', '').replace(')', '')
+            # isdecimal() (unlike isdigit()) only accepts strings int() can parse
+            total_apps += int(apps_text) if apps_text.isdecimal() else 0
+            total_goals += int(goals_text) if goals_text.isdecimal() else 0
 
     data.update({
         'Brighton and Hove Albion league appearances': total_apps,
         'Brighton and Hove Albion league goals': total_goals,
-        'number of spells at Brighton and Hove Albion': len(set(spell_seasons)),
+        'number of spells at Brighton and Hove Albion': len(seen_seasons),
         'seasons played at Brighton': spell_seasons[0] if spell_seasons else "",
         'seasons at brighton during second spell': spell_seasons[1] if len(spell_seasons) > 1 else ""
     })
 
-    all_rows = soup.find('table', {'class': 'wikitable'}).find_all('tr') if soup.find('table', {'class': 'wikitable'}) else []
+    # The first table with an exact 'wikitable' class is already among career_tables
+    first_wikitable = next((table for table in career_tables if 'wikitable' in table.get('class', '').split()), None)
+    all_rows = _XP_ROWS(first_wikitable) if first_wikitable is not None else []
     first_spell_index = -1
     for i, row in enumerate(all_rows):
-        if any("Brighton & Hove Albion" in col.get_text(strip=True) for col in row.find_all(['th', 'td'])):
-            if first_spell_index == -1:
-                first_spell_index = i
+        if row not in row_texts:
+            row_texts[row] = [_text(col) for col in _XP_CELLS(row)]
+        if any("Brighton & Hove Albion" in text for text in row_texts[row]):
+            first_spell_index = i
+            break
             
     if first_spell_index > 1:
-        before_row_cells = all_rows[first_spell_index - 1].find_all('td')
-        data['Team played for before Brighton and Hove Albion (first spell)'] = before_row_cells[1].get_text(strip=True) if len(before_row_cells) > 1 else ""
+        before_row_cells = _XP_TD(all_rows[first_spell_index - 1])
+        data['Team played for before Brighton and Hove Albion (first spell)'] = _text(before_row_cells[1]) if len(before_row_cells) > 1 else ""
     else:
         data['Team played for before Brighton and Hove Albion (first spell)'] = 'N/A (First Club)'
         
     if first_spell_index != -1:
         first_spell_end_index = first_spell_index + sum(1 for r in brighton_spells if r in all_rows[first_spell_index:]) -1
         if first_spell_end_index + 1 < len(all_rows):
-            after_row_cells = all_rows[first_spell_end_index + 1].find_all('td')
-            data['Team played for after Brighton and Hove Albion (first spell)'] = after_row_cells[1].get_text(strip=True) if len(after_row_cells) > 1 else ""
+            after_row_cells = _XP_TD(all_rows[first_spell_end_index + 1])
+            data['Team played for after Brighton and Hove Albion (first spell)'] = _text(after_row_cells[1]) if len(after_row_cells) > 1 else ""
         else:
              data['Team played for after Brighton and Hove Albion (first spell)'] = 'N/A (Last Club)'
     else:
@@ -185,23 +316,71 @@ def parse_player_page(player_url):
         
     return data
 
+async def scrape_players(season_urls, on_player):
+    """Fetches every season page, then every player page they link to, concurrently.
+
+    Each successfully parsed player dict is passed to on_player in sorted-URL order, as soon
+    as it and every player before it are ready, so the output row order is stable between runs.
+    Returns the number of player URLs processed, or None if no player URLs were found.
+    """
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=CONCURRENCY, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS, timeout=REQUEST_TIMEOUT) as session:
+        print("--- Finding all unique player URLs ---")
+        for url in season_urls:
+            print(f"Fetching season: {unquote(url.split('/')[-1])}")
+        season_results = await asyncio.gather(*(find_player_urls(session, semaphore, url) for url in season_urls))
+        all_player_urls = set().union(*season_results)
+
+        if not all_player_urls:
+            print("Could not find any player URLs. Please check the season page links and structure.")
+            return None
+
+        print(f"\nFound {len(all_player_urls)} unique player URLs to process.")
+        player_urls = sorted(all_player_urls)
+        pending = object()
+        results = [pending] * len(player_urls)  # Finished pages wait here until their turn
+        processed = next_index = 0
+
+        async def process(index, url):
+            nonlocal processed, next_index
+            results[index] = await parse_player_page(session, semaphore, url)
+            processed += 1
+            player_name_from_url = unquote(url.split('/')[-1]).replace('_', ' ')
+            print(f"Processed player {processed}/{len(player_urls)}: {player_name_from_url}")
+            while next_index < len(results) and results[next_index] is not pending:
+                player_data, results[next_index] = results[next_index], None
+                next_index += 1
+                if player_data and player_data.get('name'):
+                    on_player(player_data)
+
+        await asyncio.gather(*(process(index, url) for index, url in enumerate(player_urls)))
+    return len(player_urls)
+
+def players_csv_writer(f):
+    """Returns a DictWriter for player dicts with the standard column order."""
+    return csv.DictWriter(f, fieldnames=CSV_COLUMNS, restval='', extrasaction='ignore', lineterminator='\n')
+
+def write_players_csv(filename, rows):
+    """Writes player dicts to a CSV file with the standard column order."""
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = players_csv_writer(f)
+        writer.writeheader()
+        writer.writerows(rows)
+
 def main():
     """Main function to run the scraper."""
+    if '--no-cache' in sys.argv[1:]:
+        clear_cache()
     if not os.path.exists(CSV_FILE_NAME):
-        headers = [
-            'name', 'date of birth', 'place of birth', 'country of birth', 'position',
-            'Brighton and Hove Albion league appearances', 'Brighton and Hove Albion league goals',
-            'number of spells at Brighton and Hove Albion',
-            'Team played for before Brighton and Hove Albion (first spell)',
-            'Team played for after Brighton and Hove Albion (first spell)',
-            'seasons played at Brighton', 'seasons at brighton during second spell'
-        ]
-        pd.DataFrame(columns=headers).to_csv(CSV_FILE_NAME, index=False)
+        write_players_csv(CSV_FILE_NAME, [])
         print(f"Created {CSV_FILE_NAME} with necessary headers.")
     
     if SEASONS_TO_RUN:
         print(f"--- Running for a subset of seasons: {SEASONS_TO_RUN} ---")
-        urls_to_process = [url for url in SEASON_URLS if any(season.replace('-', '%E2%80%93') in url for season in SEASONS_TO_RUN)]
+        # One alternation over every wanted season, so each URL is scanned once
+        wanted = re.compile('|'.join(re.escape(season.replace('-', '%E2%80%93')) for season in SEASONS_TO_RUN))
+        urls_to_process = [url for url in SEASON_URLS if wanted.search(url)]
     else:
         print("--- Running for all seasons ---")
         urls_to_process = SEASON_URLS
@@ -210,69 +389,54 @@ def main():
         print("No matching season URLs found for the specified subset. Please check the SEASONS_TO_RUN list.")
         return
 
-    all_player_urls = set()
-    print("--- Finding all unique player URLs ---")
-    for url in urls_to_process:
-        print(f"Fetching season: {unquote(url.split('/')[-1])}")
-        urls = find_player_urls(url)
-        all_player_urls.update(urls)
-        time.sleep(0.5)
-
-    if not all_player_urls:
-        print("Could not find any player URLs. Please check the season page links and structure.")
-        return
-
-    print(f"\nFound {len(all_player_urls)} unique player URLs to process.")
-    
-    all_player_data = []
-    for i, url in enumerate(sorted(list(all_player_urls))):
-        player_name_from_url = unquote(url.split('/')[-1]).replace('_', ' ')
-        print(f"Processing player {i+1}/{len(all_player_urls)}: {player_name_from_url}")
-        player_data = parse_player_page(url)
-        if player_data and player_data.get('name'):
-            all_player_data.append(player_data)
-        time.sleep(0.5)
-
-    if not all_player_data:
-        print("No player data was successfully scraped. Exiting.")
-        return
-
-    new_df = pd.DataFrame(all_player_data)
-    
-    final_columns = [
-        'name', 'date of birth', 'place of birth', 'country of birth', 'position',
-        'Brighton and Hove Albion league appearances', 'Brighton and Hove Albion league goals',
-        'number of spells at Brighton and Hove Albion',
-        'Team played for before Brighton and Hove Albion (first spell)',
-        'Team played for after Brighton and Hove Albion (first spell)',
-        'seasons played at Brighton', 'seasons at brighton during second spell'
-    ]
-    
-    for col in final_columns:
-        if col not in new_df.columns:
-            new_df[col] = ""
-            
-    output_df = new_df[final_columns].drop_duplicates(subset=['name']).reset_index(drop=True)
-    
+    # Rows are written (in sorted-URL order) as soon as each player is parsed, so a crash
+    # mid-run keeps everything scraped so far. The master file is only replaced once the run
+    # has finished.
     if CREATE_NEW_FILE_FOR_OUTPUT:
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         output_filename = f"brighton_players_test_run_{timestamp}.csv"
+        stream_filename = output_filename
         print(f"\n--- Creating new file for checking: {output_filename} ---")
-        output_df.to_csv(output_filename, index=False)
     else:
         output_filename = CSV_FILE_NAME
+        stream_filename = f"{CSV_FILE_NAME}.partial"
+
+    seen_names = set()
+    with open(stream_filename, 'w', newline='', encoding='utf-8') as f:
+        writer = players_csv_writer(f)
+        writer.writeheader()
+
+        def write_player(player_data):
+            # Keep the first row (in URL order) for each name
+            if player_data['name'] not in seen_names:
+                seen_names.add(player_data['name'])
+                writer.writerow(player_data)
+                f.flush()
+
+        players_found = asyncio.run(scrape_players(urls_to_process, write_player))
+
+    if players_found is None or not seen_names:
+        os.remove(stream_filename)
+        if players_found is not None:
+            print("No player data was successfully scraped. Exiting.")
+        return
+
+    if not CREATE_NEW_FILE_FOR_OUTPUT:
         if SEASONS_TO_RUN:
             print(f"\n--- Updating master file '{output_filename}' with data from specified seasons... ---")
             try:
-                original_df = pd.read_csv(output_filename)
-                original_df = original_df[~original_df['name'].isin(output_df['name'])]
-                combined_df = pd.concat([original_df, output_df], ignore_index=True)
-                combined_df.to_csv(output_filename, index=False)
+                with open(output_filename, newline='', encoding='utf-8') as f:
+                    original_rows = [row for row in csv.DictReader(f) if row['name'] not in seen_names]
             except FileNotFoundError:
-                output_df.to_csv(output_filename, index=False)
+                original_rows = []
+            with open(stream_filename, newline='', encoding='utf-8') as f:
+                new_rows = list(csv.DictReader(f))
+            # Merge into the .partial file and swap it in, so the master is never half-written
+            write_players_csv(stream_filename, original_rows + new_rows)
+            os.replace(stream_filename, output_filename)
         else:
             print(f"\n--- Overwriting master file: {output_filename} ---")
-            output_df.to_csv(output_filename, index=False)
+            os.replace(stream_filename, output_filename)
     
     print(f"\n--- Scraping complete. Data saved to {output_filename} ---")
 
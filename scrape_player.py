@@ -1,49 +1,103 @@
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import re
 
+MAX_WORKERS = 8  # Concurrent page fetches when scraping several players
+
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
+
+# One shared session so every request to Wikipedia reuses the same keep-alive
+# connection (no new TCP/TLS handshake per page), with retries on transient errors.
+# Successful responses are cached on disk for a day so reruns skip the network;
+# pass --no-cache to clear the cache first.  Created on first use, so importing
+# this module never creates the cache file.
+_SESSION = None
+
+def get_session():
+    """Return the shared cached session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests_cache.CachedSession('.wiki_cache', backend='sqlite',
+                                                expire_after=24 * 3600, allowable_codes=(200,))
+        _SESSION.headers.update(HEADERS)
+        _SESSION.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        ))
+    return _SESSION
+
+_RE_CAREER_SECTION = re.compile(r'Career_statistics|Club_career')
+_RE_SENIOR_CAREER = re.compile('Senior career')
+_RE_DOB = re.compile('Date of birth', re.I)
+_RE_POB = re.compile('Place of birth', re.I)
+_RE_POS = re.compile('Position', re.I)
+_RE_DOB_TEXT = re.compile(r'(\d{1,2} \w+ \d{4})')
+_RE_YEAR = re.compile(r'\d{4}')
+_RE_FOOTNOTE = re.compile(r'\[\d+\]')
+_RE_DISAMBIG = re.compile(r'\s*\((?:footballer|soccer|goalkeeper)[^)]*\)')
+_RE_APPS = re.compile(r'^(\d+)(?:\s*\((\d+)\))?$')
+_RE_NONDIGIT = re.compile(r'[^0-9]')
+
+# scrape_player_info only reads tables (infobox, career stats), the page heading and the
+# section-anchor spans, so everything else is skipped while parsing
+_PAGE_STRAINER = SoupStrainer(['table', 'h1', 'span'])
+
+# Player name -> URL maps, loaded once per CSV file on first lookup
+_URL_MAPS = {}
+
+def _load_player_urls(csv_file):
+    """Read the name,url CSV into a dict, keeping the first URL for a repeated name."""
+    url_map = {}
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        next(f) # Skip header
+        for line in f:
+            parts = line.strip().rsplit(',', 1)
+            if len(parts) == 2:
+                url_map.setdefault(parts[0], parts[1])
+    return url_map
+
 def get_player_url(name, csv_file='brighton_player_urls.csv'):
     """Get the Wikipedia URL for a player from the CSV file."""
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            next(f) # Skip header
-            for line in f:
-                try:
-                    parts = line.strip().rsplit(',', 1)
-                    player_name, player_url = parts
-                    if player_name == name:
-                        return player_url
-                except ValueError:
-                    continue
-        print(f"Error: Player '{name}' not found in the database.")
-        return None
+        if csv_file not in _URL_MAPS:
+            _URL_MAPS[csv_file] = _load_player_urls(csv_file)
     except Exception as e:
         print(f"Error reading or searching CSV file: {e}")
         return None
+    url = _URL_MAPS[csv_file].get(name)
+    if url is None:
+        print(f"Error: Player '{name}' not found in the database.")
+    return url
 
 def get_soup(url):
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, timeout=10)
         response.raise_for_status()
-        return BeautifulSoup(response.text, 'html.parser')
+        return BeautifulSoup(response.content, 'lxml', parse_only=_PAGE_STRAINER)
     except requests.RequestException as e:
         print(f"Error fetching {url}: {e}")
         return None
 
 def parse_infobox_club_career(infobox):
     """Parse the club career rows from the infobox (for players like Lewis Dunk)."""
-    senior_header = infobox.find('th', string=re.compile('Senior career'))
+    senior_header = infobox.find('th', string=_RE_SENIOR_CAREER)
     if not senior_header:
         return []
     club_rows = []
     tr = senior_header.find_parent('tr').find_next_sibling('tr')
     while tr:
         # Stop if we hit "National team" or another section
-        if tr.find('th') and ('National team' in tr.get_text() or 'Medal record' in tr.get_text()):
-            break
+        if tr.find('th'):
+            tr_text = tr.get_text()
+            if 'National team' in tr_text or 'Medal record' in tr_text:
+                break
         cells = tr.find_all(['th', 'td'])
         if len(cells) >= 4:
             years = cells[0].get_text(strip=True)
@@ -52,16 +106,16 @@ def parse_infobox_club_career(infobox):
             apps = cells[2].get_text(strip=True)
             goals = cells[3].get_text(strip=True)
             # Sometimes apps is like '436 (26)'
-            apps_match = re.match(r'^(\d+)(?:\s*\((\d+)\))?$', apps)
+            apps_match = _RE_APPS.match(apps)
             if apps_match:
                 apps_val = int(apps_match.group(1))
                 if apps_match.group(2):
                     goals_val = int(apps_match.group(2))
                 else:
-                    goals_val = int(goals) if goals.isdigit() else 0
+                    goals_val = int(goals) if goals.isdecimal() else 0
             else:
-                apps_val = int(re.sub(r'[^0-9]', '', apps)) if re.sub(r'[^0-9]', '', apps) else 0
-                goals_val = int(re.sub(r'[^0-9]', '', goals)) if re.sub(r'[^0-9]', '', goals) else 0
+                apps_val = int(_RE_NONDIGIT.sub('', apps)) if _RE_NONDIGIT.sub('', apps) else 0
+                goals_val = int(_RE_NONDIGIT.sub('', goals)) if _RE_NONDIGIT.sub('', goals) else 0
             club_rows.append({'years': years, 'club': club, 'apps': apps_val, 'goals': goals_val})
         tr = tr.find_next_sibling('tr')
     return club_rows
@@ -75,22 +129,22 @@ def scrape_player_info(url):
     data = {}
     
     # --- Attempt to get data from infobox ---
-    infobox = soup.find('table', class_=re.compile(r'\binfobox\b'))
+    infobox = soup.select_one('table.infobox')
     if not infobox:
         # Try a more robust selector: any table whose class contains 'infobox'
         infobox = soup.find('table', {'class': lambda x: x and 'infobox' in x})
     if infobox:
-        name_element = infobox.find(class_=re.compile(r'\bfn\b')) or infobox.find('caption')
+        name_element = infobox.select_one('.fn') or infobox.find('caption')
         if name_element:
-            data['name'] = re.sub(r'\s*\((footballer|soccer|goalkeeper)[^)]*\)', '', name_element.get_text(strip=True)).strip()
+            data['name'] = _RE_DISAMBIG.sub('', name_element.get_text(strip=True)).strip()
         # Robust date of birth extraction
-        dob_th = infobox.find('th', string=re.compile('Date of birth', re.I))
+        dob_th = infobox.find('th', string=_RE_DOB)
         if dob_th:
             dob_td = dob_th.find_next_sibling('td')
             if dob_td:
                 dob_text = dob_td.get_text(" ", strip=True)
                 # Try to extract date in format '21 November 1991' or similar
-                dob_match = re.search(r'(\d{1,2} \w+ \d{4})', dob_text)
+                dob_match = _RE_DOB_TEXT.search(dob_text)
                 if dob_match:
                     # Format as DD-MMM-YY
                     from datetime import datetime
@@ -102,7 +156,7 @@ def scrape_player_info(url):
                 data['date of birth'] = ''
         else:
             data['date of birth'] = ''
-        pob_th = infobox.find('th', string=re.compile('Place of birth', re.I))
+        pob_th = infobox.find('th', string=_RE_POB)
         if pob_th:
             pob_text = pob_th.find_next_sibling('td').get_text(strip=True)
             pob_parts = [p.strip() for p in pob_text.split(',')]
@@ -110,19 +164,19 @@ def scrape_player_info(url):
             data['country of birth'] = pob_parts[-1] if len(pob_parts) > 1 else ""
         else:
             data['place of birth'], data['country of birth'] = "", ""
-        pos_th = infobox.find('th', string=re.compile('Position', re.I))
-        data['position'] = re.sub(r'\[\d+\]', '', pos_th.find_next_sibling('td').get_text(strip=True)).strip() if pos_th else ""
+        pos_th = infobox.find('th', string=_RE_POS)
+        data['position'] = _RE_FOOTNOTE.sub('', pos_th.find_next_sibling('td').get_text(strip=True)).strip() if pos_th else ""
     else:
         # Debug: print all table classes on the page
         print(f"  -> Warning: Could not find infobox for {url}. Parsing other data.")
         print("  -> Table classes found on page:")
         for t in soup.find_all('table'):
             print("   ", t.get('class'))
-        data['name'] = re.sub(r'\s*\((footballer|soccer|goalkeeper)[^)]*\)', '', soup.find('h1', {'id': 'firstHeading'}).get_text(strip=True)).strip()
+        data['name'] = _RE_DISAMBIG.sub('', soup.find('h1', {'id': 'firstHeading'}).get_text(strip=True)).strip()
 
     # --- **REWRITTEN LOGIC**: Find career stats table and parse it intelligently ---
-    career_header = soup.find('span', id=re.compile(r'Career_statistics|Club_career'))
-    career_table = career_header.find_next('table', class_=re.compile(r'wikitable')) if career_header else None
+    career_header = soup.find('span', id=_RE_CAREER_SECTION)
+    career_table = career_header.find_next('table', class_='wikitable') if career_header else None
 
     if not career_table:
         # Fallback: Try to parse infobox club career table
@@ -161,60 +215,61 @@ def scrape_player_info(url):
     all_rows = career_table.find_all('tr')
     total_apps, total_goals = 0, 0
     spell_seasons = []
+    seen_seasons = set()
     in_brighton_section = False
+    first_spell_index = -1
+
+    # Single pass over the table: cells and their stripped text are extracted once per row
+    for i, row in enumerate(all_rows):
+        cols = row.find_all(['th', 'td'])
+        cols_text = [col.get_text(strip=True) for col in cols]
+        mentions_brighton = any("Brighton & Hove Albion" in text for text in cols_text)
+        if first_spell_index == -1 and mentions_brighton:
+            first_spell_index = i
 
-    for row in all_rows:
         header_cell = row.find('th')
         if header_cell and 'colspan' in header_cell.attrs:
             in_brighton_section = "Brighton & Hove Albion" in header_cell.get_text()
             continue
 
-        cols = row.find_all(['th', 'td'])
-        if len(cols) > 3 and "Brighton & Hove Albion" in row.get_text():
+        if len(cols) > 3 and mentions_brighton:
              in_brighton_section = True # Handle multi-club tables
         
         # If we are in a Brighton section, or the row itself mentions Brighton
         if in_brighton_section:
+            # Every index used below exists once the row has more than 3 cells
             if len(cols) > 3:
-                try:
-                    # Determine column indices based on table type
-                    if in_brighton_section and not "Brighton & Hove Albion" in cols[0].get_text():
-                        # Dunk-style table
-                        season_index, apps_index, goals_index = 0, 2, 3
-                    else:
-                        # Zamora-style table
-                        season_index, apps_index, goals_index = 0, -2, -1
+                # Determine column indices based on table type
+                if in_brighton_section and not "Brighton & Hove Albion" in cols_text[0]:
+                    # Dunk-style table
+                    season_index, apps_index, goals_index = 0, 2, 3
+                else:
+                    # Zamora-style table
+                    season_index, apps_index, goals_index = 0, -2, -1
+                
+                year_col_text = cols_text[season_index]
+                if _RE_YEAR.search(year_col_text):
+                    seasons = _RE_FOOTNOTE.sub('', year_col_text).strip().replace('→', '').strip()
+                    if seasons not in seen_seasons:
+                        seen_seasons.add(seasons)
+                        spell_seasons.append(seasons)
+                    
+                    apps_text = cols_text[apps_index]
+                    goals_text = cols_text[goals_index].replace('(', '').replace(')', '')
                     
-                    year_col_text = cols[season_index].get_text(strip=True)
-                    if re.search(r'\d{4}', year_col_text):
-                        seasons = re.sub(r'\[\d+\]', '', year_col_text).strip().replace('→', '').strip()
-                        if seasons not in spell_seasons:
-                            spell_seasons.append(seasons)
-                        
-                        apps_text = cols[apps_index].get_text(strip=True)
-                        goals_text = cols[goals_index].get_text(strip=True).replace('(', '').replace(')', '')
-                        
-                        total_apps += int(apps_text) if apps_text.isdigit() else 0
-                        total_goals += int(goals_text) if goals_text.isdigit() else 0
-                except (ValueError, IndexError):
-                    continue
+                    total_apps += int(apps_text) if apps_text.isdecimal() else 0
+                    total_goals += int(goals_text) if goals_text.isdecimal() else 0
         # Reset if we hit another club header
         if header_cell and 'colspan' in header_cell.attrs and "Brighton & Hove Albion" not in header_cell.get_text():
             in_brighton_section = False
             
     data['Brighton and Hove Albion league appearances'] = total_apps
     data['Brighton and Hove Albion league goals'] = total_goals
-    data['number of spells at Brighton and Hove Albion'] = len(set(spell_seasons)) if spell_seasons else 1
+    data['number of spells at Brighton and Hove Albion'] = len(seen_seasons) if spell_seasons else 1
     data['seasons played at Brighton'] = spell_seasons[0] if spell_seasons else ""
     data['seasons at brighton during second spell'] = spell_seasons[1] if len(spell_seasons) > 1 else ""
 
     # Find "before" and "after" clubs robustly
-    first_spell_index = -1
-    for i, row in enumerate(all_rows):
-        if any("Brighton & Hove Albion" in col.get_text(strip=True) for col in row.find_all(['th', 'td'])):
-            if first_spell_index == -1:
-                first_spell_index = i
-            
     if first_spell_index > 1:
         before_row = all_rows[first_spell_index - 1]
         before_cells = before_row.find_all('td')
@@ -230,7 +285,8 @@ def scrape_player_info(url):
         start_search_index = first_spell_index + len(spell_seasons)
         for i in range(start_search_index, len(all_rows)):
             row = all_rows[i]
-            if "Total" in row.get_text() or "Brighton" in row.get_text():
+            row_text = row.get_text()
+            if "Total" in row_text or "Brighton" in row_text:
                 continue
             
             cells = row.find_all('td')
@@ -241,6 +297,12 @@ def scrape_player_info(url):
     return data
 
 def main():
+    args = sys.argv[1:]
+    # Create the shared session before any worker threads can race to create it
+    session = get_session()
+    if '--no-cache' in args:
+        args.remove('--no-cache')
+        session.cache.clear()
     columns = [
         'name',
         'date of birth',
@@ -255,17 +317,19 @@ def main():
         'seasons played at Brighton',
         'seasons at brighton during second spell'
     ]
-    if len(sys.argv) == 1:
+    if not args:
         test_players = [
             "Lewis Dunk",
             "Bobby Zamora",
         ]
-        for player_name in test_players:
+        urls = [get_player_url(player_name) for player_name in test_players]
+        # Fetch every page at once over the shared session; map() keeps the output in order
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            infos = list(executor.map(lambda url: scrape_player_info(url) if url else None, urls))
+        for player_name, url, player_info in zip(test_players, urls, infos):
             print(f"\n=== Testing: {player_name} ===")
-            url = get_player_url(player_name)
             if not url:
                 continue
-            player_info = scrape_player_info(url)
             if not player_info:
                 continue
             print("Player Information:")
@@ -273,10 +337,10 @@ def main():
             for col in columns:
                 print(f"{col}: {player_info.get(col, '')}")
         return
-    if len(sys.argv) != 2:
-        print("Usage: python scrape_player.py \"Player Name\"")
+    if len(args) != 1:
+        print("Usage: python scrape_player.py [--no-cache] \"Player Name\"")
         return
-    player_name = sys.argv[1]
+    player_name = args[0]
     url = get_player_url(player_name)
     if not url:
         return
@@ -5,6 +5,8 @@ Run with:  pytest test_app.py -v
 """
 
 import json
+import os
+import time
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
@@ -13,67 +15,118 @@ import pytest
 
 import app as app_module
 
+# Player name -> players_df index, built once for tests that target a player by name
+NAME_TO_IDX = dict(zip(app_module.players_df["name"], app_module.players_df.index.tolist()))
+
+VALID_POSITIONS = frozenset({"Goalkeeper", "Defender", "Midfielder", "Forward", "Winger", "Full-back"})
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def _app_setup(tmp_path_factory):
+    """Configure the app once: testing mode, production debug flag, no player override,
+    and data files redirected away from the real recent_players.json / gemini_cache.json.
+
+    Tests that need other values change them with monkeypatch so they revert automatically.
+    """
+    data_dir = tmp_path_factory.mktemp("data")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(app_module.app.config, "TESTING", True)
+        mp.setattr(app_module.app, "debug", False)
+        mp.setattr(app_module, "current_player_index", None)
+        mp.setattr(app_module, "RECENT_PLAYERS_FILE", str(data_dir / "recent_players.json"))
+        mp.setattr(app_module, "GEMINI_CACHE_FILE", str(data_dir / "gemini_cache.json"))
+        yield
+
+
+@pytest.fixture(scope="module")
 def client():
-    """Flask test client in production mode (debug=False)."""
-    original_debug = app_module.app.debug
-    app_module.app.config["TESTING"] = True
-    app_module.app.debug = False
-    with app_module.app.test_client() as c:
-        yield c
-    app_module.app.debug = original_debug
+    """Flask test client in production mode (debug=False), shared by the module."""
+    return app_module.app.test_client()
 
 
 @pytest.fixture
-def debug_client():
-    """Flask test client in debug mode (debug=True)."""
-    original_debug = app_module.app.debug
-    original_index = app_module.current_player_index
-    app_module.app.config["TESTING"] = True
-    app_module.app.debug = True
-    with app_module.app.test_client() as c:
-        yield c
-    app_module.app.debug = original_debug
-    app_module.current_player_index = original_index
+def debug_client(client, monkeypatch):
+    """The shared test client with debug mode (debug=True) enabled for one test."""
+    monkeypatch.setattr(app_module.app, "debug", True)
+    # Restores any player override a test sets through /api/set-player
+    monkeypatch.setattr(app_module, "current_player_index", app_module.current_player_index)
+    return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def challenge(client):
+    """Today's /api/daily-challenge payload, fetched once for the module."""
+    return client.get("/api/daily-challenge").get_json()
+
+
+@pytest.fixture(scope="session")
 def sample_player():
     """Lewis Dunk — 'Still at club', single spell."""
     return app_module.players_df.iloc[71]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def retired_player():
     """Bruno Saltor — 'Retired' in left_for field."""
     return app_module.players_df.iloc[61]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def still_at_club_player():
     """Lewis Dunk — 'Still at club'."""
     return app_module.players_df.iloc[71]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def second_spell_player():
     """Bobby Zamora — has a second spell at Brighton (2015-2016)."""
     return app_module.players_df.iloc[6]
 
 
+@pytest.fixture(scope="session")
+def sample_clues(sample_player):
+    """build_clues(sample_player, seed=42), computed once for the session."""
+    return app_module.build_clues(sample_player, seed=42)
+
+
+@pytest.fixture(scope="session")
+def clues_by_idx():
+    """build_clues(seed=42) for every player, computed once and shared across tests."""
+    return {idx: app_module.build_clues(app_module.players_df.iloc[idx], seed=42)
+            for idx in range(len(app_module.players_df))}
+
+
 @pytest.fixture
 def mock_recent_players_file(tmp_path):
-    """Redirect recent_players.json to a temp directory."""
+    """Redirect recent_players.json to a temp directory (with an empty daily-player cache)."""
     temp_file = str(tmp_path / "recent_players.json")
-    with patch.object(app_module, "RECENT_PLAYERS_FILE", temp_file):
+    with patch.object(app_module, "RECENT_PLAYERS_FILE", temp_file), \
+            patch.dict(app_module._TODAY_CACHE, {"date": None, "player": None}):
+        yield temp_file
+
+
+@pytest.fixture
+def mock_gemini_cache(tmp_path):
+    """Redirect gemini_cache.json to a temp directory, starting from empty caches."""
+    temp_file = str(tmp_path / "gemini_cache.json")
+    with patch.object(app_module, "GEMINI_CACHE_FILE", temp_file), \
+            patch.dict(app_module._CRYPTIC_CACHE, clear=True), \
+            patch.dict(app_module._BIO_CACHE, clear=True):
         yield temp_file
 
 
+@pytest.fixture
+def mocked_model(mock_gemini_cache):
+    """Swap in a MagicMock Gemini model; tests set generate_content's behaviour."""
+    model = MagicMock()
+    with patch.object(app_module, "model", model):
+        yield model
+
+
 # ---------------------------------------------------------------------------
 # 1. Data Integrity
 # ---------------------------------------------------------------------------
@@ -104,67 +157,96 @@ class TestDataIntegrity:
         assert "first name" in app_module.players_df.columns
         assert "last name" in app_module.players_df.columns
 
-    def test_no_empty_names(self):
-        for _, row in app_module.players_df.iterrows():
-            assert row["name"].strip() != "", f"Empty name at index {row.name}"
+    def test_precomputed_clue_columns(self):
+        player = app_module.players_df.iloc[71]  # Lewis Dunk
+        assert player["_era"] == app_module._extract_era(player["seasons played at Brighton"])
+        goals = player["Brighton and Hove Albion league goals"]
+        assert player["_goals_clue"] == f"This player scored {goals} league goals for Brighton."
+
+    def test_player_records_match_dataframe(self):
+        assert len(app_module.PLAYERS) == len(app_module.players_df)
+        for idx in (0, 71, len(app_module.players_df) - 1):
+            record = app_module.PLAYERS[idx]
+            assert record["player_id"] == idx
+            assert record["name"] == app_module.players_df.iloc[idx]["name"]
+
+    def test_no_empty_names(self, player_row_tuple):
+        assert player_row_tuple.name.strip() != "", f"Empty name at index {player_row_tuple.Index}"
 
     def test_no_empty_dob(self):
-        for _, row in app_module.players_df.iterrows():
-            assert str(row["date of birth"]).strip() != "", f"Empty DOB for {row['name']}"
+        df = app_module.players_df
+        empty = df["date of birth"].astype(str).str.strip().eq("")
+        assert not empty.any(), f"Empty DOB for {df.loc[empty, 'name'].tolist()}"
 
     def test_no_duplicate_names(self):
-        names = app_module.players_df["name"].tolist()
-        assert len(names) == len(set(names)), "Duplicate player names found"
+        df = app_module.players_df
+        duplicated = df["name"].duplicated()
+        assert not duplicated.any(), f"Duplicate player names found: {df.loc[duplicated, 'name'].tolist()}"
 
     def test_all_players_have_first_name(self):
-        for _, row in app_module.players_df.iterrows():
-            assert row["first name"].strip() != "", f"Empty first name for: {row['name']}"
+        df = app_module.players_df
+        empty = df["first name"].str.strip().eq("")
+        assert not empty.any(), f"Empty first name for: {df.loc[empty, 'name'].tolist()}"
 
     def test_positions_are_valid(self):
-        valid = {"Goalkeeper", "Defender", "Midfielder", "Forward", "Winger", "Full-back"}
-        for _, row in app_module.players_df.iterrows():
-            parts = [p.strip() for p in row["position"].replace("/", ",").split(",")]
-            for part in parts:
-                assert part in valid, f"Invalid position '{part}' for {row['name']}"
+        df = app_module.players_df
+        parts = df["position"].str.split(r"[,/]", regex=True).explode().str.strip()
+        invalid = ~parts.isin(VALID_POSITIONS)
+        assert not invalid.any(), (
+            f"Invalid positions: {dict(zip(df.loc[parts.index[invalid], 'name'], parts[invalid]))}"
+        )
 
     def test_appearances_are_numeric(self):
-        for _, row in app_module.players_df.iterrows():
-            int(row["Brighton and Hove Albion league appearances"])
+        pd.to_numeric(app_module.players_df["Brighton and Hove Albion league appearances"], errors="raise")
 
 
 # ---------------------------------------------------------------------------
-# 2. split_name
+# 2. split_names
 # ---------------------------------------------------------------------------
 
+def split_one(name):
+    """split_names for a single name, as a (first, last) tuple."""
+    first, last = app_module.split_names(pd.Series([name], dtype=object))
+    return first[0], last[0]
+
+
 class TestSplitName:
 
     def test_split_standard_name(self):
-        assert app_module.split_name("Lewis Dunk") == ("Lewis", "Dunk")
+        assert split_one("Lewis Dunk") == ("Lewis", "Dunk")
 
     def test_split_single_name(self):
-        assert app_module.split_name("Bernardo") == ("Bernardo", "")
+        assert split_one("Bernardo") == ("Bernardo", "")
 
     def test_split_multi_part_last_name(self):
-        first, last = app_module.split_name("Alexis Mac Allister")
+        first, last = split_one("Alexis Mac Allister")
         assert first == "Alexis"
         assert last == "Mac Allister"
 
     def test_split_nan_value(self):
-        assert app_module.split_name(float("nan")) == ("", "")
+        assert split_one(float("nan")) == ("", "")
 
     def test_split_name_with_quotes(self):
-        assert app_module.split_name('"Lewis Dunk"') == ("Lewis", "Dunk")
+        assert split_one('"Lewis Dunk"') == ("Lewis", "Dunk")
 
     def test_split_name_with_whitespace(self):
-        first, last = app_module.split_name("  Lewis Dunk  ")
+        first, last = split_one("  Lewis Dunk  ")
         assert first == "Lewis"
         assert last == "Dunk"
 
+    def test_split_preserves_index(self):
+        names = pd.Series(["Lewis Dunk", "Bernardo"], index=[5, 9])
+        first, last = app_module.split_names(names)
+        assert first.to_dict() == {5: "Lewis", 9: "Bernardo"}
+        assert last.to_dict() == {5: "Dunk", 9: ""}
+
     def test_all_players_produce_two_parts(self):
-        for _, row in app_module.players_df.iterrows():
-            result = app_module.split_name(row["name"])
-            assert len(result) == 2, f"Bad split for {row['name']}"
-            assert result[0] != "", f"Empty first name from split for {row['name']}"
+        df = app_module.players_df
+        empty = df["first name"].str.len().eq(0)
+        assert not empty.any(), f"Empty first name from split for {df.loc[empty, 'name'].tolist()}"
+        rebuilt = (df["first name"] + " " + df["last name"]).str.strip()
+        mismatched = rebuilt.ne(df["name"].str.strip().str.strip('"'))
+        assert not mismatched.any(), f"Name split loses text for {df.loc[mismatched, 'name'].tolist()}"
 
 
 # ---------------------------------------------------------------------------
@@ -173,21 +255,18 @@ class TestSplitName:
 
 class TestBuildClues:
 
-    def test_returns_nonempty_list(self, sample_player):
-        clues = app_module.build_clues(sample_player, seed=42)
-        assert len(clues) > 0
+    def test_returns_nonempty_list(self, sample_clues):
+        assert len(sample_clues) > 0
 
-    def test_deterministic_with_same_seed(self, sample_player):
-        a = app_module.build_clues(sample_player, seed=42)
-        b = app_module.build_clues(sample_player, seed=42)
-        assert a == b
+    def test_deterministic_with_same_seed(self, sample_player, sample_clues):
+        # One fresh call against the session-cached result keeps the real path exercised
+        assert app_module.build_clues(sample_player, seed=42) == sample_clues
 
-    def test_different_seed_produces_different_result(self, sample_player):
-        a = app_module.build_clues(sample_player, seed=42)
-        b = app_module.build_clues(sample_player, seed=99)
+    def test_different_seed_produces_different_result(self, sample_player, sample_clues):
+        other = app_module.build_clues(sample_player, seed=99)
         # Different seeds should produce a different list (order and/or content
         # may differ because shuffle order affects fact-dedup outcomes)
-        assert a != b
+        assert sample_clues != other
 
     def test_retired_player_excludes_left_for(self, retired_player):
         clues = app_module.build_clues(retired_player, seed=42)
@@ -195,9 +274,8 @@ class TestBuildClues:
             assert "left Brighton to join" not in clue
             assert "Retired" not in clue
 
-    def test_retired_medical_excludes_left_for(self):
-        player = app_module.players_df.iloc[119]  # Enock Mwepu
-        clues = app_module.build_clues(player, seed=42)
+    def test_retired_medical_excludes_left_for(self, clues_by_idx):
+        clues = clues_by_idx[119]  # Enock Mwepu
         for clue in clues:
             assert "left Brighton to join" not in clue
             assert "Retired" not in clue
@@ -212,27 +290,35 @@ class TestBuildClues:
         clues = app_module.build_clues(second_spell_player, seed=42)
         assert any("second spell" in c.lower() for c in clues)
 
-    def test_no_second_spell_excluded(self, sample_player):
-        clues = app_module.build_clues(sample_player, seed=42)
-        assert not any("second spell" in c.lower() for c in clues)
+    def test_no_second_spell_excluded(self, sample_clues):
+        assert not any("second spell" in c.lower() for c in sample_clues)
 
-    def test_no_duplicate_facts(self, sample_player):
-        clues = app_module.build_clues(sample_player, seed=42)
-        birth_full = [c for c in clues if "was born on" in c]
-        birth_spells = [c for c in clues if "was born in" in c and "spell(s)" in c]
+    def test_no_duplicate_facts(self, sample_clues):
+        birth_full = [c for c in sample_clues if "was born on" in c]
+        birth_spells = [c for c in sample_clues if "was born in" in c and "spell(s)" in c]
         assert not (birth_full and birth_spells), "Both birth clues present — fact dedup failed"
 
-    def test_clue_count_range(self):
-        for idx in range(min(20, len(app_module.players_df))):
-            player = app_module.players_df.iloc[idx]
-            clues = app_module.build_clues(player, seed=42)
-            assert 4 <= len(clues) <= 9, (
-                f"Player {player['name']} has {len(clues)} clues"
-            )
+    @pytest.mark.parametrize("idx", range(min(20, len(app_module.players_df))))
+    def test_clue_count_range(self, idx, clues_by_idx):
+        clues = clues_by_idx[idx]
+        assert 4 <= len(clues) <= 9, (
+            f"Player {app_module.players_df.iloc[idx]['name']} has {len(clues)} clues"
+        )
 
-    def test_all_clues_are_nonempty_strings(self, sample_player):
-        clues = app_module.build_clues(sample_player, seed=42)
-        for clue in clues:
+    def test_default_seed_for_dataframe_row(self, sample_player):
+        """A players_df row has no player_id, so its index seeds the shuffle."""
+        assert app_module.build_clues(sample_player) == app_module.build_clues(sample_player, seed="71")
+
+    def test_default_seed_for_player_record(self):
+        assert app_module.build_clues(app_module.PLAYERS[71]) == app_module.build_clues(app_module.PLAYERS[71], seed="71")
+
+    def test_player_clues_match_build_clues(self):
+        expected = app_module.build_clues(app_module.players_df.iloc[71], seed="71")
+        assert list(app_module._player_clues(71)) == expected
+        assert app_module._player_clues(71) is app_module._player_clues(71)
+
+    def test_all_clues_are_nonempty_strings(self, sample_clues):
+        for clue in sample_clues:
             assert isinstance(clue, str)
             assert clue.strip() != ""
 
@@ -243,30 +329,71 @@ class TestBuildClues:
 
 class TestRecentPlayers:
 
-    def test_load_missing_file(self, mock_recent_players_file):
+    @pytest.fixture(autouse=True)
+    def recent_players_file(self):
+        """The session-redirected recent_players.json (see _app_setup), removed before each test."""
+        path = app_module.RECENT_PLAYERS_FILE
+        if os.path.exists(path):
+            os.remove(path)
+        return path
+
+    @staticmethod
+    def temp_files(path):
+        """Leftover *.tmp files next to path."""
+        return [f for f in os.listdir(os.path.dirname(path)) if f.endswith(".tmp")]
+
+    def test_load_missing_file(self, recent_players_file):
         result = app_module.load_recent_players()
         assert result == {}
 
-    def test_load_invalid_json(self, mock_recent_players_file):
-        with open(mock_recent_players_file, "w") as f:
+    def test_load_invalid_json(self, recent_players_file):
+        with open(recent_players_file, "w") as f:
             f.write("not json {{{")
         result = app_module.load_recent_players()
         assert result == {}
 
-    def test_save_and_load_roundtrip(self, mock_recent_players_file):
-        today = datetime.combine(datetime.now().date(), datetime.min.time())
+    def test_save_and_load_roundtrip(self, recent_players_file):
+        today = datetime.now().date().isoformat()
         app_module.save_recent_players({today: 42})
         loaded = app_module.load_recent_players()
         assert today in loaded
         assert loaded[today] == 42
 
-    def test_save_overwrites_existing(self, mock_recent_players_file):
-        today = datetime.combine(datetime.now().date(), datetime.min.time())
+    def test_save_overwrites_existing(self, recent_players_file):
+        today = datetime.now().date().isoformat()
         app_module.save_recent_players({today: 10})
         app_module.save_recent_players({today: 20})
         loaded = app_module.load_recent_players()
         assert loaded[today] == 20
 
+    def test_save_leaves_no_temp_file(self, recent_players_file):
+        app_module.save_recent_players({"2025-07-12": 17})
+        assert self.temp_files(recent_players_file) == []
+
+    def test_save_uses_its_own_temp_file(self, recent_players_file):
+        """Another worker's in-flight temp file must not collide with this write."""
+        other_tmp = recent_players_file + ".tmp"
+        os.mkdir(other_tmp)  # A fixed-name temp path would fail to open
+        try:
+            app_module.save_recent_players({"2025-07-12": 17})
+        finally:
+            os.rmdir(other_tmp)
+        assert app_module.load_recent_players() == {"2025-07-12": 17}
+
+    def test_failed_save_keeps_old_file_and_removes_temp(self, recent_players_file):
+        app_module.save_recent_players({"2025-07-12": 17})
+        with patch.object(app_module.os, "replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                app_module.save_recent_players({"2025-07-12": 99})
+        assert app_module.load_recent_players() == {"2025-07-12": 17}
+        assert self.temp_files(recent_players_file) == []
+
+    def test_load_legacy_datetime_keys(self, recent_players_file):
+        """Files written before the date-string format used full ISO datetime keys."""
+        with open(recent_players_file, "w") as f:
+            json.dump({"2025-07-12T00:00:00": 17}, f)
+        assert app_module.load_recent_players() == {"2025-07-12": 17}
+
 
 # ---------------------------------------------------------------------------
 # 5. get_daily_player
@@ -275,8 +402,6 @@ class TestRecentPlayers:
 class TestGetDailyPlayer:
 
     def test_same_date_returns_same_player(self, mock_recent_players_file):
-        app_module.app.debug = False
-        app_module.current_player_index = None
         p1 = app_module.get_daily_player()
         p2 = app_module.get_daily_player()
         assert p1["name"] == p2["name"]
@@ -284,8 +409,8 @@ class TestGetDailyPlayer:
     def test_no_repeats_in_full_cycle(self, mock_recent_players_file):
         """Verify the permutation cycle selects every eligible player exactly once."""
         import random
-        eligible = [idx for idx in range(len(app_module.players_df))
-                    if app_module.players_df.iloc[idx]['Brighton and Hove Albion league appearances'] > 0]
+        rows = app_module.players_df[["Brighton and Hove Albion league appearances"]].itertuples(index=False, name=None)
+        eligible = [idx for idx, (apps,) in enumerate(rows) if apps > 0]
         pool_size = len(eligible)
         # Simulate one full cycle (cycle 0)
         rng = random.Random(0)
@@ -294,21 +419,30 @@ class TestGetDailyPlayer:
         assert len(set(shuffled)) == pool_size  # no duplicates
         assert set(shuffled) == set(eligible)   # all players covered
 
-    def test_debug_override(self, mock_recent_players_file):
-        app_module.app.debug = True
-        app_module.current_player_index = 50
+    def test_cycle_order_is_permutation_of_pool(self):
+        order = app_module._cycle_order(3)
+        assert sorted(order) == sorted(app_module.ELIGIBLE_INDICES.tolist())
+        assert app_module._cycle_order(3) is order  # reused within a cycle
+
+    def test_debug_override(self, mock_recent_players_file, monkeypatch):
+        monkeypatch.setattr(app_module.app, "debug", True)
+        monkeypatch.setattr(app_module, "current_player_index", 50)
         player = app_module.get_daily_player()
         assert player["name"] == app_module.players_df.iloc[50]["name"]
-        app_module.current_player_index = None
-        app_module.app.debug = False
 
     def test_caches_selection(self, mock_recent_players_file):
-        app_module.app.debug = False
-        app_module.current_player_index = None
         app_module.get_daily_player()
         loaded = app_module.load_recent_players()
         assert len(loaded) > 0
 
+    def test_repeat_call_served_from_cache(self, mock_recent_players_file):
+        first = app_module.get_daily_player()
+        with patch.object(app_module, "load_recent_players") as mock_load:
+            second = app_module.get_daily_player()
+        mock_load.assert_not_called()
+        assert second["name"] == first["name"]
+        assert app_module._TODAY_CACHE["date"] == datetime.now().date()
+
 
 # ---------------------------------------------------------------------------
 # 6. API Routes
@@ -321,19 +455,24 @@ class TestAPIRoutes:
         assert resp.status_code == 200
         assert "text/html" in resp.content_type
 
-    def test_daily_challenge_structure(self, client):
-        data = client.get("/api/daily-challenge").get_json()
+    def test_daily_challenge_structure(self, challenge):
         for key in ("firstNameLength", "lastNameLength", "firstClue",
                      "player_id", "firstName", "lastName"):
-            assert key in data, f"Missing key: {key}"
+            assert key in challenge, f"Missing key: {key}"
 
-    def test_daily_challenge_name_lengths_match(self, client):
-        data = client.get("/api/daily-challenge").get_json()
-        assert data["firstNameLength"] == len(data["firstName"])
-        assert data["lastNameLength"] == len(data["lastName"])
+    def test_daily_challenge_name_lengths_match(self, challenge):
+        assert challenge["firstNameLength"] == len(challenge["firstName"])
+        assert challenge["lastNameLength"] == len(challenge["lastName"])
 
-    def test_clues_returns_clue(self, client):
-        challenge = client.get("/api/daily-challenge").get_json()
+    def test_daily_challenge_served_from_cache(self, client):
+        first = client.get("/api/daily-challenge")
+        with patch.object(app_module, "_player_clues") as mock_clues:
+            second = client.get("/api/daily-challenge")
+        mock_clues.assert_not_called()
+        assert second.get_json() == first.get_json()
+        assert second.headers["Cache-Control"].startswith("no-store")
+
+    def test_clues_returns_clue(self, client, challenge):
         resp = client.post("/api/clues", json={
             "player_id": challenge["player_id"],
             "clue_index": 0,
@@ -343,8 +482,7 @@ class TestAPIRoutes:
         assert "clue" in data
         assert len(data["clue"]) > 0
 
-    def test_guess_correct(self, client):
-        challenge = client.get("/api/daily-challenge").get_json()
+    def test_guess_correct(self, client, challenge):
         resp = client.post("/api/guess", json={
             "player_id": challenge["player_id"],
             "guess_first": challenge["firstName"],
@@ -354,8 +492,7 @@ class TestAPIRoutes:
         assert data["correct"] is True
         assert "fullName" in data
 
-    def test_guess_correct_case_insensitive(self, client):
-        challenge = client.get("/api/daily-challenge").get_json()
+    def test_guess_correct_case_insensitive(self, client, challenge):
         resp = client.post("/api/guess", json={
             "player_id": challenge["player_id"],
             "guess_first": challenge["firstName"].lower(),
@@ -363,8 +500,7 @@ class TestAPIRoutes:
         })
         assert resp.get_json()["correct"] is True
 
-    def test_guess_incorrect(self, client):
-        challenge = client.get("/api/daily-challenge").get_json()
+    def test_guess_incorrect(self, client, challenge):
         resp = client.post("/api/guess", json={
             "player_id": challenge["player_id"],
             "guess_first": "WrongName",
@@ -427,7 +563,7 @@ class TestDebugEndpoints:
         resp = client.get("/api/debug/reset-recent")
         assert resp.status_code == 403
 
-    def test_reset_recent_works_in_debug(self, debug_client):
+    def test_reset_recent_works_in_debug(self, debug_client, mock_recent_players_file):
         resp = debug_client.get("/api/debug/reset-recent")
         assert resp.status_code == 200
         assert resp.get_json()["success"] is True
@@ -449,28 +585,53 @@ class TestGeminiRoutes:
             resp = client.post("/api/player-bio", json={"player_id": 72})
             assert resp.status_code == 503
 
-    def test_cryptic_clue_success_with_mock(self, client):
-        mock_model = MagicMock()
-        mock_model.generate_content.return_value = MagicMock(text="A clever clue")
-        with patch.object(app_module, "model", mock_model):
-            resp = client.post("/api/cryptic-clue", json={"player_id": 72})
-            assert resp.status_code == 200
-            assert "clue" in resp.get_json()
+    def test_cryptic_clue_success_with_mock(self, client, mocked_model):
+        mocked_model.generate_content.return_value = MagicMock(text="A clever clue")
+        resp = client.post("/api/cryptic-clue", json={"player_id": 72})
+        assert resp.status_code == 200
+        assert "clue" in resp.get_json()
 
-    def test_player_bio_success_with_mock(self, client):
-        mock_model = MagicMock()
-        mock_model.generate_content.return_value = MagicMock(text="A brief bio.")
-        with patch.object(app_module, "model", mock_model):
-            resp = client.post("/api/player-bio", json={"player_id": 72})
-            assert resp.status_code == 200
-            assert "bio" in resp.get_json()
+    def test_player_bio_success_with_mock(self, client, mocked_model):
+        mocked_model.generate_content.return_value = MagicMock(text="A brief bio.")
+        resp = client.post("/api/player-bio", json={"player_id": 72})
+        assert resp.status_code == 200
+        assert "bio" in resp.get_json()
 
-    def test_cryptic_clue_handles_api_error(self, client):
-        mock_model = MagicMock()
-        mock_model.generate_content.side_effect = Exception("API quota exceeded")
-        with patch.object(app_module, "model", mock_model):
-            resp = client.post("/api/cryptic-clue", json={"player_id": 72})
-            assert resp.status_code == 500
+    def test_cryptic_clue_handles_api_error(self, client, mocked_model):
+        mocked_model.generate_content.side_effect = Exception("API quota exceeded")
+        resp = client.post("/api/cryptic-clue", json={"player_id": 72})
+        assert resp.status_code == 500
+
+    def test_player_bio_handles_timeout(self, client, mocked_model):
+        mocked_model.generate_content.side_effect = lambda *args, **kwargs: time.sleep(0.5)
+        with patch.object(app_module, "GEMINI_TIMEOUT_SECONDS", 0.05):
+            resp = client.post("/api/player-bio", json={"player_id": 72})
+        assert resp.status_code == 500
+
+    def test_cryptic_clue_cached_per_player(self, client, mocked_model):
+        mocked_model.generate_content.return_value = MagicMock(text="A clever clue")
+        client.post("/api/cryptic-clue", json={"player_id": 72})
+        resp = client.post("/api/cryptic-clue", json={"player_id": 72})
+        assert resp.get_json()["clue"] == "A clever clue"
+        assert mocked_model.generate_content.call_count == 1
+
+    def test_player_bio_cache_persisted(self, client, mocked_model, mock_gemini_cache):
+        mocked_model.generate_content.return_value = MagicMock(text="A brief bio.")
+        client.post("/api/player-bio", json={"player_id": 72})
+        name = app_module.PLAYERS[72]["name"]
+        with open(mock_gemini_cache) as f:
+            assert json.load(f)["bio"] == {name: "A brief bio."}
+        assert app_module.load_gemini_cache()[1] == {name: "A brief bio."}
+
+    def test_gemini_cache_save_keeps_other_workers_entries(self, client, mocked_model, mock_gemini_cache):
+        """The other gunicorn worker's saved responses survive this worker's save."""
+        with open(mock_gemini_cache, "w") as f:
+            json.dump({"cryptic": {"Bobby Zamora": "Another worker's clue"}, "bio": {}}, f)
+        mocked_model.generate_content.return_value = MagicMock(text="A clever clue")
+        client.post("/api/cryptic-clue", json={"player_id": 72})
+        cryptic, _ = app_module.load_gemini_cache()
+        assert cryptic == {"Bobby Zamora": "Another worker's clue",
+                           app_module.PLAYERS[72]["name"]: "A clever clue"}
 
 
 # ---------------------------------------------------------------------------
@@ -480,9 +641,8 @@ class TestGeminiRoutes:
 class TestSpecialCharacters:
 
     def _find_player_index(self, name):
-        matches = app_module.players_df[app_module.players_df["name"] == name]
-        assert len(matches) == 1, f"Player '{name}' not found"
-        return int(matches.index[0])
+        assert name in NAME_TO_IDX, f"Player '{name}' not found"
+        return NAME_TO_IDX[name]
 
     def test_guess_with_apostrophe(self, debug_client):
         idx = self._find_player_index("Mark O'Mahony")
@@ -515,6 +675,11 @@ class TestSpecialCharacters:
         })
         assert resp.get_json()["correct"] is True
 
+    def test_normalized_names_precomputed_for_every_player(self):
+        assert len(app_module._NAMES_NORM) == len(app_module.players_df)
+        idx = self._find_player_index("Mark O'Mahony")
+        assert app_module._NAMES_NORM[idx] == ("mark", "o'mahony")
+
     def test_apostrophe_name_lengths_include_special_char(self, debug_client):
         """Name length should include the apostrophe character."""
         idx = self._find_player_index("Mark O'Mahony")
@@ -529,42 +694,47 @@ class TestSpecialCharacters:
 
 class TestClueLogic:
 
-    def test_era_clue_suppressed_when_seasons_exist(self):
+    def test_era_clue_suppressed_when_seasons_exist(self, clues_by_idx):
         """Era clue ('played during the 2010s') should not appear when seasons data exists."""
-        player = app_module.players_df.iloc[71]  # Lewis Dunk — has seasons data
-        clues = app_module.build_clues(player, seed=42)
+        clues = clues_by_idx[71]  # Lewis Dunk — has seasons data
         for clue in clues:
             assert "played for Brighton during the" not in clue
 
-    def test_seasons_clue_says_at_not_played_at(self):
+    def test_seasons_clue_says_at_not_played_at(self, clues_by_idx):
         """Seasons clue should say 'Seasons at Brighton' not 'Seasons played at Brighton'."""
-        player = app_module.players_df.iloc[71]
-        clues = app_module.build_clues(player, seed=42)
+        clues = clues_by_idx[71]
         seasons_clues = [c for c in clues if "Seasons at Brighton:" in c]
         assert len(seasons_clues) > 0, "Seasons clue should be present"
         for c in clues:
             assert "Seasons played at Brighton" not in c
 
-    def test_no_duplicate_clue_text_for_any_player(self):
+    def test_no_duplicate_clue_text_for_any_player(self, clues_by_idx):
         """Every player's clue list must contain only unique text (no repeated clues)."""
-        for idx in range(len(app_module.players_df)):
-            player = app_module.players_df.iloc[idx]
-            clues = app_module.build_clues(player, seed=42)
+        for idx, clues in clues_by_idx.items():
             assert len(clues) == len(set(clues)), (
-                f"Player {player['name']} (id={idx}) has duplicate clue text: "
+                f"Player {app_module.players_df.iloc[idx]['name']} (id={idx}) has duplicate clue text: "
                 f"{[c for c in clues if clues.count(c) > 1]}"
             )
 
-    def test_era_suppression_across_multiple_players(self):
+    def test_extract_era_single_decade(self):
+        assert app_module._extract_era("2010-2015") == "the 2010s"
+
+    def test_extract_era_spans_decades(self):
+        assert app_module._extract_era("2008-2012, 2018-2021") == "the 2000s and 2020s"
+
+    def test_extract_era_without_years(self):
+        assert app_module._extract_era("") == ""
+        assert app_module._extract_era("unknown") == ""
+
+    @pytest.mark.parametrize("idx", range(min(30, len(app_module.players_df))))
+    def test_era_suppression_across_multiple_players(self, idx, clues_by_idx):
         """For any player with seasons data, era clue should be suppressed."""
-        for idx in range(min(30, len(app_module.players_df))):
-            player = app_module.players_df.iloc[idx]
-            if player["seasons played at Brighton"]:
-                clues = app_module.build_clues(player, seed=42)
-                for clue in clues:
-                    assert "played for Brighton during the" not in clue, (
-                        f"Era clue leaked for {player['name']}"
-                    )
+        player = app_module.players_df.iloc[idx]
+        if player["seasons played at Brighton"]:
+            for clue in clues_by_idx[idx]:
+                assert "played for Brighton during the" not in clue, (
+                    f"Era clue leaked for {player['name']}"
+                )
 
 
 # ---------------------------------------------------------------------------
@@ -575,30 +745,97 @@ class TestPlayerSelectionFilter:
 
     def test_daily_player_has_league_appearances(self, mock_recent_players_file):
         """Daily player should always have at least 1 league appearance."""
-        app_module.app.debug = False
-        app_module.current_player_index = None
         player = app_module.get_daily_player()
         assert int(player["Brighton and Hove Albion league appearances"]) > 0
 
     def test_zero_appearance_players_exist_in_csv(self):
         """Confirm zero-appearance players exist (validates that the filter matters)."""
-        zero_apps = app_module.players_df[
-            app_module.players_df["Brighton and Hove Albion league appearances"] == 0
-        ]
-        assert len(zero_apps) > 0
+        assert (app_module.players_df["Brighton and Hove Albion league appearances"] == 0).any()
 
     def test_eligible_pool_excludes_zero_appearances(self):
         """The selection pool used by get_daily_player should exclude zero-appearance players."""
-        eligible = [
-            idx for idx in range(len(app_module.players_df))
-            if app_module.players_df.iloc[idx]["Brighton and Hove Albion league appearances"] > 0
-        ]
-        zero_apps = [
-            idx for idx in range(len(app_module.players_df))
-            if app_module.players_df.iloc[idx]["Brighton and Hove Albion league appearances"] == 0
-        ]
+        apps = app_module.players_df["Brighton and Hove Albion league appearances"].astype(int)
+        eligible_mask = apps > 0
+        zero_mask = apps == 0
         # All zero-appearance players should be excluded from the eligible pool
-        for idx in zero_apps:
-            assert idx not in eligible
+        assert not (eligible_mask & zero_mask).any()
+        assert not zero_mask.to_numpy()[app_module.ELIGIBLE_INDICES].any()
         # Eligible pool should be smaller than total
-        assert len(eligible) < len(app_module.players_df)
+        assert eligible_mask.sum() < len(app_module.players_df)
+
+    def test_eligible_indices_match_appearance_filter(self):
+        """The precomputed ELIGIBLE_INDICES pool should match a per-row appearances > 0 filter."""
+        rows = app_module.players_df[["Brighton and Hove Albion league appearances"]].itertuples(index=False, name=None)
+        expected = [idx for idx, (apps,) in enumerate(rows) if apps > 0]
+        assert app_module.ELIGIBLE_INDICES.tolist() == expected
+
+
+# ---------------------------------------------------------------------------
+# 12. Player Data Loading (CSV / Parquet)
+# ---------------------------------------------------------------------------
+
+class TestLoadPlayers:
+
+    HEADER = ("name,date of birth,place of birth,country of birth,position,"
+              "Brighton and Hove Albion league appearances,Brighton and Hove Albion league goals,"
+              "number of spells at Brighton and Hove Albion,"
+              "Team played for before Brighton and Hove Albion (first spell),"
+              "Team played for after Brighton and Hove Albion (first spell),"
+              "seasons played at Brighton,seasons at brighton during second spell\n")
+
+    @pytest.fixture
+    def data_files(self, tmp_path, monkeypatch):
+        """Point load_players at a temp CSV/Parquet pair; returns (csv_path, parquet_path)."""
+        csv_file, parquet_file = tmp_path / "players.csv", tmp_path / "players.parquet"
+        monkeypatch.setattr(app_module, "CSV_FILE_NAME", str(csv_file))
+        monkeypatch.setattr(app_module, "PARQUET_FILE_NAME", str(parquet_file))
+        return csv_file, parquet_file
+
+    def test_goals_clue_only_for_known_goal_counts(self, data_files):
+        csv_file, _ = data_files
+        csv_file.write_text(self.HEADER
+                            + "Lewis Dunk,1991-11-21,Brighton,England,Defender,350,0,1,,Still at club,2010-,\n"
+                            + "Bobby Zamora,1981-01-16,London,England,Forward,100,,2,,,2000-2003,\n")
+        df = app_module.load_players()
+        assert df["_goals_clue"].tolist() == ["This player scored 0 league goals for Brighton.", ""]
+
+    def test_blank_numeric_cells_load_as_na(self, data_files):
+        csv_file, _ = data_files
+        csv_file.write_text(self.HEADER + "Lewis Dunk,1991-11-21,Brighton,England,Defender,,,1,,Still at club,2010-,\n")
+        df = app_module.load_players()
+        assert len(df) == 1
+        assert pd.isna(df.loc[0, "Brighton and Hove Albion league appearances"])
+        assert pd.isna(df.loc[0, "Brighton and Hove Albion league goals"])
+        assert df.loc[0, "_goals_clue"] == ""
+        assert df.loc[0, "Team played for before Brighton and Hove Albion (first spell)"] == ""
+        clues = app_module.build_clues(df.iloc[0], seed=42)
+        assert not any("league appearances" in c or "league goals" in c for c in clues)
+
+    def test_missing_optional_column_is_filled(self, data_files):
+        csv_file, _ = data_files
+        header = self.HEADER.replace(",seasons at brighton during second spell", "")
+        csv_file.write_text(header + "Lewis Dunk,1991-11-21,Brighton,England,Defender,350,25,1,,Still at club,2010-\n")
+        df = app_module.load_players()
+        assert df.loc[0, "seasons at brighton during second spell"] == ""
+        assert df.loc[0, "Brighton and Hove Albion league appearances"] == 350
+
+    def test_fresh_parquet_preferred_over_csv(self, data_files):
+        csv_file, parquet_file = data_files
+        csv_file.write_text(self.HEADER + "Lewis Dunk,1991-11-21,Brighton,England,Defender,350,25,1,,Still at club,2010-,\n")
+        parquet_df = app_module.read_players_csv(str(csv_file))
+        parquet_df["name"] = "Bobby Zamora"
+        parquet_df.to_parquet(parquet_file, index=False)
+        os.utime(csv_file, (1_000_000, 1_000_000))
+        assert app_module._parquet_is_fresh()
+        assert app_module.load_players().loc[0, "name"] == "Bobby Zamora"
+
+    def test_stale_or_missing_parquet_falls_back_to_csv(self, data_files):
+        csv_file, parquet_file = data_files
+        csv_file.write_text(self.HEADER + "Lewis Dunk,1991-11-21,Brighton,England,Defender,350,25,1,,Still at club,2010-,\n")
+        assert not app_module._parquet_is_fresh()
+        parquet_df = app_module.read_players_csv(str(csv_file))
+        parquet_df["name"] = "Bobby Zamora"
+        parquet_df.to_parquet(parquet_file, index=False)
+        os.utime(parquet_file, (1_000_000, 1_000_000))
+        assert not app_module._parquet_is_fresh()
+        assert app_module.load_players().loc[0, "name"] == "Lewis Dunk"
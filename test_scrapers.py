@@ -0,0 +1,218 @@
+"""
+Offline regression tests for the Wikipedia scrapers (no network access needed).
+
+Run with:  pytest test_scrapers.py -v   (needs requirements-scraper.txt)
+"""
+
+import asyncio
+import csv
+import importlib
+import os
+import sys
+from contextlib import asynccontextmanager
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+import scrape_brighton_players as sb
+
+
+class FakeResponse:
+    """Just enough of aiohttp.ClientResponse for fetch()."""
+
+    def __init__(self, status=200, text=""):
+        self.status = status
+        self._text = text
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(None, (), status=self.status)
+
+    async def text(self):
+        return self._text
+
+
+class FakeSession:
+    """Replays one outcome per request: an exception to raise or a FakeResponse to return."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    @asynccontextmanager
+    async def get(self, url):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        yield outcome
+
+
+@pytest.fixture
+def fast_fetch(tmp_path, monkeypatch):
+    """Run fetch() against a temp page cache with no backoff or request delay."""
+    monkeypatch.setattr(sb, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(sb, "BACKOFF_FACTOR", 0)
+    monkeypatch.setattr(sb, "REQUEST_DELAY", 0)
+
+
+def run_fetch(session, url="https://en.wikipedia.org/wiki/Lewis_Dunk"):
+    return asyncio.run(sb.fetch(session, asyncio.Semaphore(1), url))
+
+
+# ---------------------------------------------------------------------------
+# scrape_brighton_players.fetch
+# ---------------------------------------------------------------------------
+
+class TestFetch:
+
+    @pytest.mark.parametrize("error", [aiohttp.ClientConnectionError("reset"), asyncio.TimeoutError()])
+    def test_connection_error_then_success_is_retried(self, fast_fetch, error):
+        session = FakeSession([error, FakeResponse(text="<html>ok</html>")])
+        assert run_fetch(session) == "<html>ok</html>"
+        assert session.calls == 2
+
+    def test_retry_status_then_success_is_retried(self, fast_fetch):
+        session = FakeSession([FakeResponse(status=503), FakeResponse(text="<html>ok</html>")])
+        assert run_fetch(session) == "<html>ok</html>"
+        assert session.calls == 2
+
+    def test_connection_errors_raise_after_max_retries(self, fast_fetch):
+        session = FakeSession([aiohttp.ClientConnectionError("reset")] * (sb.MAX_RETRIES + 1))
+        with pytest.raises(aiohttp.ClientConnectionError):
+            run_fetch(session)
+        assert session.calls == sb.MAX_RETRIES + 1
+
+    def test_fetched_page_is_cached(self, fast_fetch):
+        run_fetch(FakeSession([FakeResponse(text="<html>ok</html>")]))
+        # Served from the cache: this session would fail if asked for the page
+        assert run_fetch(FakeSession([])) == "<html>ok</html>"
+        assert [f for f in os.listdir(sb.CACHE_DIR) if f.endswith(".tmp")] == []
+
+    def test_failed_cache_write_leaves_no_page(self, fast_fetch, monkeypatch):
+        """An interrupted write must not leave a partial page to be served as a cache hit."""
+        def interrupted_replace(src, dst):
+            raise OSError("interrupted")
+
+        monkeypatch.setattr(sb.os, "replace", interrupted_replace)
+        with pytest.raises(OSError):
+            run_fetch(FakeSession([FakeResponse(text="<html>ok</html>")]))
+        assert os.listdir(sb.CACHE_DIR) == []
+
+    def test_client_error_status_is_not_retried(self, fast_fetch):
+        session = FakeSession([FakeResponse(status=404)])
+        with pytest.raises(aiohttp.ClientResponseError):
+            run_fetch(session)
+        assert session.calls == 1
+
+
+# ---------------------------------------------------------------------------
+# scrape_brighton_players.scrape_players
+# ---------------------------------------------------------------------------
+
+class TestScrapePlayers:
+
+    def test_players_delivered_in_sorted_url_order(self, monkeypatch):
+        """Pages that finish out of order are still handed on in sorted-URL order."""
+        urls = [f"https://en.wikipedia.org/wiki/Player_{letter}" for letter in "ABCDE"]
+        # The first URL finishes last, the last URL finishes first
+        delays = dict(zip(urls, (0.05, 0.04, 0.03, 0.02, 0.01)))
+
+        async def fake_find_player_urls(session, semaphore, season_url):
+            return set(urls)
+
+        async def fake_parse_player_page(session, semaphore, player_url):
+            await asyncio.sleep(delays[player_url])
+            return {"name": player_url.rsplit("_", 1)[-1]}
+
+        monkeypatch.setattr(sb, "find_player_urls", fake_find_player_urls)
+        monkeypatch.setattr(sb, "parse_player_page", fake_parse_player_page)
+        names = []
+        count = asyncio.run(sb.scrape_players(["season"], lambda player: names.append(player["name"])))
+        assert count == len(urls)
+        assert names == list("ABCDE")
+
+    def test_failed_pages_do_not_block_later_players(self, monkeypatch):
+        urls = [f"https://en.wikipedia.org/wiki/Player_{letter}" for letter in "ABC"]
+
+        async def fake_find_player_urls(session, semaphore, season_url):
+            return set(urls)
+
+        async def fake_parse_player_page(session, semaphore, player_url):
+            return None if player_url.endswith("B") else {"name": player_url.rsplit("_", 1)[-1]}
+
+        monkeypatch.setattr(sb, "find_player_urls", fake_find_player_urls)
+        monkeypatch.setattr(sb, "parse_player_page", fake_parse_player_page)
+        names = []
+        asyncio.run(sb.scrape_players(["season"], lambda player: names.append(player["name"])))
+        assert names == ["A", "C"]
+
+
+# ---------------------------------------------------------------------------
+# scrape_player shared session
+# ---------------------------------------------------------------------------
+
+class TestScrapePlayerSession:
+
+    @pytest.fixture
+    def fresh_scrape_player(self, tmp_path, monkeypatch):
+        """A freshly imported scrape_player, run from an empty temp directory."""
+        pytest.importorskip("requests_cache")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delitem(sys.modules, "scrape_player", raising=False)
+        return importlib.import_module("scrape_player")
+
+    def test_import_creates_no_cache_file(self, fresh_scrape_player, tmp_path):
+        assert list(tmp_path.iterdir()) == []
+
+    def test_session_created_once_on_first_use(self, fresh_scrape_player, tmp_path):
+        session = fresh_scrape_player.get_session()
+        assert fresh_scrape_player.get_session() is session
+        assert (tmp_path / ".wiki_cache.sqlite").exists()
+
+
+# ---------------------------------------------------------------------------
+# scrape_brighton_players.main (master-file update)
+# ---------------------------------------------------------------------------
+
+class TestMainMasterUpdate:
+
+    @pytest.fixture
+    def master_run(self, tmp_path, monkeypatch):
+        """Run main() against a temp master CSV, updating it for one season with faked scraping."""
+        monkeypatch.chdir(tmp_path)
+        sb.write_players_csv(sb.CSV_FILE_NAME, [
+            {"name": "Lewis Dunk", "position": "Defender"},
+            {"name": "Bobby Zamora", "position": "Midfielder"},
+        ])
+        monkeypatch.setattr(sb, "CREATE_NEW_FILE_FOR_OUTPUT", False)
+        monkeypatch.setattr(sb, "SEASONS_TO_RUN", ["2024-25"])
+        monkeypatch.setattr(sb, "SEASON_URLS", ["https://en.wikipedia.org/wiki/2024%E2%80%9325_season"])
+
+        async def fake_scrape_players(season_urls, on_player):
+            on_player({"name": "Bobby Zamora", "position": "Forward"})
+            return 1
+
+        monkeypatch.setattr(sb, "scrape_players", fake_scrape_players)
+        return tmp_path
+
+    def read_master(self):
+        with open(sb.CSV_FILE_NAME, newline="", encoding="utf-8") as f:
+            return [(row["name"], row["position"]) for row in csv.DictReader(f)]
+
+    def test_season_update_merges_into_master(self, master_run):
+        sb.main()
+        assert self.read_master() == [("Lewis Dunk", "Defender"), ("Bobby Zamora", "Forward")]
+        assert sorted(p.name for p in master_run.iterdir()) == [sb.CSV_FILE_NAME]
+
+    def test_interrupted_merge_leaves_master_intact(self, master_run, monkeypatch):
+        def interrupted_write(filename, rows):
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write("name,date")  # Cut off mid-header
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(sb, "write_players_csv", interrupted_write)
+        with pytest.raises(KeyboardInterrupt):
+            sb.main()
+        assert self.read_master() == [("Lewis Dunk", "Defender"), ("Bobby Zamora", "Midfielder")]